@@ -2,3 +2,23 @@
 # -*- coding:utf-8 -*-
 """Ensemble de modules, classes et méthodes facilitatrices pour la réalisation
 d'études pseudo-scientifiques."""
+
+import importlib
+
+# Sous-modules importés à leur première utilisation, afin que l'importation
+# du package ne construise aucune unité
+_SUBMODULES = ('data', 'geometry', 'humanity', 'light', 'misc', 'movement',
+               'relativity', 'stream', 'transport', 'units')
+
+
+def __getattr__(name):
+    """Importer un sous-module lors du premier accès à l'attribut
+    correspondant (Python 3.7 et ultérieurs)."""
+    if name in _SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(
+        __name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -5,3 +5,39 @@ précédents ou après des recherches. Destiné à accélérer la réalisation
 d'études ou de calculs préliminaires. Les valeurs pouvant être calculées
 par le projet ou obtenues de manière plus précise devraient être privilégiées.
 """
+
+import importlib
+
+# Noms exposés par le package, associés au sous-module qui les définit. Les
+# sous-modules ne sont importés, et leurs unités construites, qu'au premier
+# accès à l'un de leurs noms.
+_NAMES = dict(
+    [(name, 'constants') for name in (
+        'LIGHT_VELOCITY', 'EARTH_GRAVITY', 'ATOMIC_MASS', 'BOHR_RADIUS',
+        'ELECTRON_RADIUS', 'ELECTRON_MASS', 'PROTON_MASS', 'NEUTRON_MASS',
+        'MUON_MASS', 'TAUON_MASS', 'W_BOSON_MASS', 'Z_BOSON_MASS',
+        'PLANCK_MASS', 'PLANCK_TIME', 'PLANCK_LENGTH', 'PLANCK_AREA',
+        'PLANCK_FORCE', 'PLANCK_CONSTANT')] +
+    [(name, 'food') for name in (
+        'EU_ENERGY_INTAKE', 'USA_ENERGY_INTAKE', 'load_consequences_all',
+        'load_consequences', 'load_rdi_all', 'load_rdi')] +
+    [('PREFIX_LIST', 'text'), ('lille_metro', 'vehicles')])
+_SUBMODULES = ('constants', 'food', 'text', 'vehicles')
+
+
+def __getattr__(name):
+    """Importer un sous-module ou l'un de ses noms lors du premier accès
+    (Python 3.7 et ultérieurs)."""
+    if name in _SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    if name in _NAMES:
+        module = importlib.import_module('.' + _NAMES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(
+        __name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES) | set(_NAMES))
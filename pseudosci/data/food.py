@@ -7,17 +7,16 @@ https://github.com/Lucidiot/PseudoScience/wiki/Nomenclature-des-nutriments"""
 
 from ..units.general import Mass, Energy
 from ..humanity.food import NutrientAmount
-import json
-import inspect
 import os
 
-EU_ENERGY_INTAKE = Energy(kcal=2000)
-USA_ENERGY_INTAKE = Energy(kcal=2000)
+EU_ENERGY_INTAKE = Energy.constant(kcal=2000)
+USA_ENERGY_INTAKE = Energy.constant(kcal=2000)
 
 
 def load_consequences_all(file=None):
     """Charger toutes les conséquences pour la santé de l'excès ou carence en
     nutriments."""
+    import json
     with open(_parse_file_path(file, 'food_consequences.json'), 'r') as f:
         return json.loads(f.read())
 
@@ -30,6 +29,7 @@ def load_consequences(lang, file=None):
 
 def load_rdi_all(file=None):
     """Charger toutes les valeurs nutritionnelles de référence."""
+    import json
     with open(_parse_file_path(file, 'food_rdi.json'), 'r') as f:
         parsed_json = json.loads(f.read())
     return {k: _parse_rdi_json(parsed_json[k]) for k in parsed_json}
@@ -38,6 +38,7 @@ def load_rdi_all(file=None):
 def load_rdi(variant, file=None):
     """Charger un ensemble de valeurs nutritionnelles de référence selon son
     code de variante."""
+    import json
     with open(_parse_file_path(file, 'food_rdi.json'), 'r') as f:
         return _parse_rdi_json(json.loads(f.read())[variant])
 
@@ -52,7 +53,6 @@ def _parse_file_path(path, default):
     """Convertir un chemin de fichier en chemin absolu proprement."""
     if path is None:  # Use default
         return default if os.path.isabs(default) else \
-            os.path.dirname(inspect.getfile(inspect.currentframe())) + '/' + \
-            default
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), default)
     else:
         return os.path.abspath(path)
@@ -8,7 +8,7 @@ from ..transport.vehicle import Vehicle
 from ..units.general import Velocity, Acceleration, Mass
 
 # Métro lillois (VAL 206) - https://fr.wikipedia.org/wiki/VAL_206
-lille_metro = Vehicle(velocity=Velocity(kph=80),
-                      accel=Acceleration(mpss=1.4),
-                      brake=Acceleration(mpss=1.3),
-                      mass=Mass(t=30.5))
+lille_metro = Vehicle(velocity=Velocity.constant(kph=80),
+                      accel=Acceleration.constant(mpss=1.4),
+                      brake=Acceleration.constant(mpss=1.3),
+                      mass=Mass.constant(t=30.5))
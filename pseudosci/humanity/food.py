@@ -58,7 +58,7 @@ class Food(object):
         """Instancie une nourriture avec les nom, quantité d'énergie et apports
         nutritionnels fournis. La quantité d'énergie est représentée pour un
         kilogramme de nourriture."""
-        if type(energy) is not Energy:
+        if not isinstance(energy, Energy):
             raise TypeError("La quantité d'énergie doit être une instance de "
                             "pseudosci.units.Energy.")
         if type(nutrients) is not NutrientData:
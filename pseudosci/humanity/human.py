@@ -11,9 +11,9 @@ class Human(object):
 
     def __init__(self, weight, height):
         """Instancier un nouvel humain."""
-        if type(weight) is not Mass:
+        if not isinstance(weight, Mass):
             raise TypeError("Le poids doit être une instance de Mass.")
-        if type(height) is not Distance:
+        if not isinstance(height, Distance):
             raise TypeError("La hauteur doit être une instance de Distance.")
         self.weight = weight
         self.height = height
@@ -3,6 +3,7 @@
 """Tests relatifs à la consommation de nourriture humaine."""
 
 from ...units.general import Mass, Energy
+from ...data.food import EU_ENERGY_INTAKE
 from ..food import TypedDict, NutrientData, NutrientAmount, Food
 import pytest
 
@@ -51,3 +52,5 @@ class TestFood:
             Food('Test', Mass(kg=4), d)
         with pytest.raises(TypeError):
             Food('Test', e, Mass(kg=4))
+        food = Food('Ration', EU_ENERGY_INTAKE, d)
+        assert food.energy.kcal == pytest.approx(2000)
@@ -21,6 +21,8 @@ class TestHuman:
             Human(w, 4)
         with pytest.raises(TypeError):
             Human("lol", h)
+        m = Human(Mass.constant(kg=70), Distance.constant(m=1.75))
+        assert m.bmi == pytest.approx(70 / 1.75 ** 2)
 
     def test_attributes(self):
         """Test des attributs de la classe."""
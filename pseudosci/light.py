@@ -7,6 +7,9 @@ from .units.geometry import Angle
 from .units.general import Energy
 from math import pi
 
+# Angle d'un tour complet, partagé par tous les calculs
+FULL_TURN = Angle.constant(rad=2 * pi)
+
 
 class Wave(object):
     """Décrit une onde oscillatoire de tout type.
@@ -84,7 +87,7 @@ class Wave(object):
 
     @property
     def angular_frequency(self):
-        return Angle(rad=2 * pi) * self.frequency
+        return FULL_TURN * self.frequency
 
 
 class ElectromagneticWave(Wave):
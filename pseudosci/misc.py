@@ -2,6 +2,8 @@
 # -*- coding:utf-8 -*-
 """Fonctions utilitaires généralistes."""
 
+from bisect import bisect_right
+from math import floor, log10, isinf, isnan
 from .data.text import PREFIX_LIST
 from .units import Unit
 
@@ -18,18 +20,141 @@ def movingavg(Lx, Ly, p=1):
     return Lxout, Lyout
 
 
+class Prefixes(object):
+    """Table de préfixes précalculée. Les facteurs des préfixes sont triés une
+    fois pour toutes et indexés par puissance de dix, si bien que le préfixe
+    d'une valeur est choisi en temps constant à partir de son logarithme
+    décimal : c'est le plus grand facteur inférieur ou égal à la valeur
+    absolue. Par défaut, pseudosci.data.text.PREFIX_LIST est utilisée."""
+
+    def __init__(self, prefixes=PREFIX_LIST):
+        items = sorted(prefixes.items(), key=lambda item: item[1])
+        if items and items[0][1] <= 0:
+            raise ValueError("Prefix factors must be positive.")
+        self.names = [name for (name, factor) in items]
+        self.factors = [float(factor) for (name, factor) in items]
+        if items:
+            self.low = int(floor(log10(self.factors[0])))
+            high = int(floor(log10(self.factors[-1])))
+        else:
+            (self.low, high) = (0, -1)
+        # Indice du plus grand facteur inférieur ou égal à chaque puissance
+        # de dix, de 10 ** low à 10 ** high
+        self.table = [bisect_right(self.factors, 10.0 ** e) - 1
+                      for e in range(self.low, high + 1)]
+
+    def __len__(self):
+        return len(self.factors)
+
+    def index(self, value):
+        """Obtenir l'indice du préfixe d'une valeur, ou -1 si aucun préfixe ne
+        convient."""
+        value = abs(value)
+        if not self.table or not value or isinf(value) or isnan(value):
+            return -1
+        e = min(max(int(floor(log10(value))), self.low),
+                self.low + len(self.table) - 1)
+        i = self.table[e - self.low]
+        # Corriger les imprécisions du logarithme et les facteurs qui ne sont
+        # pas des puissances de dix
+        factors = self.factors
+        while i + 1 < len(factors) and factors[i + 1] <= value:
+            i += 1
+        while i >= 0 and factors[i] > value:
+            i -= 1
+        return i
+
+    def find(self, value):
+        """Obtenir le couple (nom, facteur) du préfixe d'une valeur, ou None
+        si aucun préfixe ne convient."""
+        i = self.index(value)
+        return (self.names[i], self.factors[i]) if i >= 0 else None
+
+    def format(self, unit):
+        """Effectuer le préfixage d'une unité."""
+        i = self.index(unit.value)
+        if i < 0:
+            return str(unit)
+        value = unit.value / self.factors[i]
+        return "{0} {1}{2}".format(value, self.names[i], unit.fullname
+                                   if abs(value) == 1 else unit.pluralname)
+
+    def indices(self, values):
+        """Obtenir les indices des préfixes d'un tableau NumPy de valeurs,
+        -1 lorsqu'aucun préfixe ne convient."""
+        import numpy
+        values = numpy.abs(numpy.asarray(values, dtype=numpy.float64))
+        valid = numpy.isfinite(values) & (values > 0)
+        if not self.table:
+            return numpy.full(values.shape, -1, dtype=numpy.intp)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            e = numpy.where(valid, numpy.floor(numpy.log10(values)),
+                            self.low)
+        e = numpy.clip(e, self.low, self.low + len(self.table) - 1)
+        i = numpy.asarray(self.table, dtype=numpy.intp)[
+            e.astype(numpy.intp) - self.low]
+        # Facteurs encadrés de sentinelles, indexés à partir de -1
+        factors = numpy.concatenate(([0.0], self.factors, [numpy.inf]))
+        while True:
+            up = factors[i + 2] <= values
+            if not up.any():
+                break
+            i += up
+        while True:
+            down = (i >= 0) & (factors[i + 1] > values)
+            if not down.any():
+                break
+            i -= down
+        i[~valid] = -1
+        return i
+
+    def format_many(self, units):
+        """Effectuer le préfixage d'un tableau d'unités, ou d'un itérable
+        d'unités. Le choix des préfixes d'un tableau d'unités est vectorisé
+        ; le package Python `numpy` est alors requis."""
+        unit = getattr(type(units), 'unit', None)
+        if unit is None:
+            return [self.format(element) for element in units]
+        values = units.values
+        indices = self.indices(values)
+        (names, factors) = (self.names, self.factors)
+        (fullname, pluralname) = (unit.fullname, unit.pluralname)
+        result = []
+        for (value, i) in zip(values.tolist(), indices.tolist()):
+            if i < 0:
+                result.append(str(unit.from_si(value)))
+                continue
+            value /= factors[i]
+            result.append("{0} {1}{2}".format(
+                value, names[i],
+                fullname if abs(value) == 1 else pluralname))
+        return result
+
+
+# Table des préfixes de pseudosci.data.text.PREFIX_LIST
+PREFIXES = Prefixes(PREFIX_LIST)
+
+
+def _prefixes(prefixes):
+    if isinstance(prefixes, Prefixes):
+        return prefixes
+    if prefixes is PREFIX_LIST:
+        return PREFIXES
+    return Prefixes(prefixes)
+
+
 def prefix(unit, prefixes=PREFIX_LIST):
-    """Effectue le préfixage d'une unité selon une liste de préfixes donnés.
-    Par défaut, pseudosci.data.text.PREFIX_LIST est utilisée."""
+    """Effectue le préfixage d'une unité selon une liste de préfixes donnés,
+    sous forme de dictionnaire ou de table Prefixes précalculée, à réutiliser
+    pour préfixer de nombreuses unités. Par défaut,
+    pseudosci.data.text.PREFIX_LIST est utilisée."""
     if not issubclass(type(unit), Unit):
         raise ValueError("Parameter `unit` must be an instance of "
                          "pseudosci.units.Unit.")
-    from operator import itemgetter
-    for key, value in sorted(prefixes.items(),
-                             key=itemgetter(1), reverse=True):
-        if unit.value // value >= 1:
-            return "{0} {1}{2}".format(unit.value / value, key, unit.fullname
-                                       if unit.value / value == 1
-                                       else unit.pluralname)
-    # Oups, aucun préfixe trouvé
-    return str(unit)
+    return _prefixes(prefixes).format(unit)
+
+
+def prefix_many(units, prefixes=PREFIX_LIST):
+    """Effectue le préfixage d'un tableau d'unités ou d'un itérable d'unités
+    et renvoie la liste des textes obtenus."""
+    return _prefixes(prefixes).format_many(units)
@@ -3,7 +3,7 @@
 """Simulation de mouvements rectilignes prenant en charge les accélérations
 et freinages."""
 
-from .units import Unit
+from .units import Unit, boundary, usum
 from .units.general import Distance, Time, Velocity, Acceleration
 
 
@@ -78,24 +78,40 @@ class Movement(object):
             return NotImplemented
 
 
+@boundary(distance=Distance, velocity=Velocity, time=Time, accel=Acceleration,
+          returns=(Distance, Velocity, Time, Acceleration))
+def _accelerate(distance, velocity, time, accel):
+    """Compléter les paramètres d'un mouvement uniformément accéléré, sur des
+    valeurs du système international."""
+    (d, v, t) = (distance, velocity, time)
+    if distance is not None and time is not None:
+        v = distance / time
+    elif distance is not None and velocity is not None:
+        t = distance / velocity
+    elif time is not None and velocity is not None:
+        d = time * velocity
+    if velocity is not None and time is not None:
+        accel = velocity / time
+        d = (accel * time * time) / 2
+    elif time is not None and distance is not None:
+        accel = 2 * distance / time / time
+        v = accel * time
+    elif velocity is not None and distance is not None:
+        t = 2 * distance / velocity
+        accel = velocity / t
+    return (d, v, t, accel)
+
+
 class AcceleratedMovement(Movement):
     """Décrit un mouvement rectiligne uniformément accéléré ou ralenti.
     Au moins trois des paramètres suivants sont obligatoires : `accel=`,
     `velocity=`, `time=`, `distance=`."""
 
     def __init__(self, distance=None, velocity=None, time=None, accel=None):
-        Movement.__init__(self,
-                          distance=distance, velocity=velocity, time=time)
-        self._accel = accel
-        if velocity and time:
-            self._accel = velocity / time
-            self._distance = (self._accel * time * time) / 2
-        elif time and distance:
-            self._accel = 2 * distance / time / time
-            self._velocity = self._accel * time
-        elif velocity and distance:
-            self._time = 2 * distance / velocity
-            self._accel = velocity / self._time
+        if (distance, velocity, time).count(None) > 1:
+            raise ValueError("Not enough arguments")
+        (self._distance, self._velocity, self._time, self._accel) = \
+            _accelerate(distance, velocity, time, accel)
 
     @property
     def accel(self):
@@ -126,11 +142,11 @@ class ComplexMovement(object):
 
     @property
     def distance(self):
-        return Distance(m=sum(self.distances))
+        return usum((m.distance for m in self.movements), Distance)
 
     @property
     def time(self):
-        return Time(s=sum(self.times))
+        return usum((m.time for m in self.movements), Time)
 
     @property
     def velocity(self):
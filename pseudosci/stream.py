@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Traitement paresseux de flux de mesures. Chaque étape consomme un itérable
+et produit ses résultats au fur et à mesure, avec une mémoire bornée ; les
+étapes se composent directement ou à travers la classe Stream :
+
+    Stream(days).apply(distance).convert(Distance, 'au').movingavg(7)
+"""
+
+from array import array
+from collections import deque
+from itertools import islice
+from math import fsum
+from six.moves import map as _map, filter as _filter
+from .units import Unit
+
+
+def convert(values, unit, name='value'):
+    """Convertir des nombres exprimés dans la conversion `name` en unités de
+    type `unit`. La conversion n'est recherchée qu'une seule fois."""
+    tosi = unit._conversion(name)[0]
+    if tosi is None:
+        raise ValueError("Conversion {0} not available for {1}".format(
+            name, unit.__name__))
+    build = unit.from_si
+    for value in values:
+        yield build(tosi(value))
+
+
+def express(units, name='value'):
+    """Exprimer des unités sous forme de nombres dans la conversion `name`.
+    La conversion est recherchée une fois par type d'unité rencontré."""
+    (unit, fromsi) = (None, None)
+    for element in units:
+        if type(element) is not unit:
+            unit = type(element)
+            fromsi = unit._conversion(name)[1]
+            if fromsi is None:
+                raise ValueError("Conversion {0} not available for "
+                                 "{1}".format(name, unit.__name__))
+        yield fromsi(element.value)
+
+
+def apply(function, *iterables):
+    """Appliquer une formule aux éléments d'un ou plusieurs flux."""
+    return _map(function, *iterables)
+
+
+def select(predicate, iterable):
+    """Ne conserver que les éléments vérifiant un prédicat."""
+    return _filter(predicate, iterable)
+
+
+def decimate(iterable, factor, offset=0):
+    """Ne conserver qu'un élément sur `factor`, à partir de `offset`."""
+    return islice(iterable, offset, None, factor)
+
+
+def window(iterable, size, step=1):
+    """Produire des fenêtres glissantes de `size` éléments, sous forme de
+    tuples, en avançant de `step` éléments à chaque fois."""
+    items = deque(maxlen=size)
+    skip = 0
+    for element in iterable:
+        items.append(element)
+        if skip:
+            skip -= 1
+        elif len(items) == size:
+            yield tuple(items)
+            skip = step - 1
+
+
+def movingavg(iterable, size):
+    """Moyenne glissante sur `size` éléments, nombres ou unités de même
+    type. Contrairement à pseudosci.misc.movingavg, seule la fenêtre courante
+    est conservée en mémoire."""
+    (values, unit) = (deque(maxlen=size), None)
+    for element in iterable:
+        if isinstance(element, Unit):
+            if unit is None:
+                unit = type(element)._unit
+            elif type(element) is not unit and \
+                    type(element)._unit is not unit:
+                raise TypeError("Cannot average {0} with {1}".format(
+                    type(element).__name__, unit.__name__))
+            element = element.value
+        values.append(element)
+        if len(values) == size:
+            average = fsum(values) / size
+            yield average if unit is None else unit.from_si(average)
+
+
+def chunks(units, size=4096):
+    """Regrouper les valeurs du système international d'unités de même type
+    en tableaux de flottants de `size` éléments au plus."""
+    (chunk, unit) = (array('d'), None)
+    for element in units:
+        if type(element) is not unit:
+            if not isinstance(element, Unit) or unit is not None and \
+                    type(element)._unit is not unit:
+                raise TypeError("Cannot chunk {0}".format(
+                    type(element).__name__))
+            unit = type(element)._unit
+        chunk.append(element.value)
+        if len(chunk) == size:
+            yield chunk
+            chunk = array('d')
+    if chunk:
+        yield chunk
+
+
+def unchunk(chunks, unit):
+    """Reconstituer un flux d'unités de type `unit` à partir de tableaux de
+    valeurs du système international."""
+    build = unit.from_si
+    for chunk in chunks:
+        for value in chunk:
+            yield build(value)
+
+
+class Stream(object):
+    """Enveloppe d'un itérable permettant d'enchaîner les étapes de
+    traitement. Le flux n'est parcouru qu'une seule fois."""
+
+    def __init__(self, iterable):
+        self.iterable = iterable
+
+    def __iter__(self):
+        return iter(self.iterable)
+
+    def convert(self, unit, name='value'):
+        return Stream(convert(self, unit, name))
+
+    def express(self, name='value'):
+        return Stream(express(self, name))
+
+    def apply(self, function):
+        return Stream(apply(function, self))
+
+    def select(self, predicate):
+        return Stream(select(predicate, self))
+
+    def decimate(self, factor, offset=0):
+        return Stream(decimate(self, factor, offset))
+
+    def window(self, size, step=1):
+        return Stream(window(self, size, step))
+
+    def movingavg(self, size):
+        return Stream(movingavg(self, size))
+
+    def chunks(self, size=4096):
+        return Stream(chunks(self, size))
+
+    def unchunk(self, unit):
+        return Stream(unchunk(self, unit))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+import subprocess
+import sys
+import pytest
+
+
+def _loaded(statement, *modules):
+    """Exécuter une instruction dans un nouvel interpréteur et obtenir les
+    modules parmi `modules` chargés à l'issue de l'instruction."""
+    code = '{0}\nimport sys\nprint(" ".join(m for m in {1!r} ' \
+        'if m in sys.modules))'.format(statement, modules)
+    return subprocess.check_output([sys.executable, '-c', code]).decode(
+        'utf-8').split()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason="requires module __getattr__")
+class TestImports:
+    """Tests de l'importation paresseuse des packages."""
+
+    def test_package(self):
+        """Importer le package ne charge aucune unité."""
+        assert _loaded('import pseudosci', 'pseudosci.units',
+                       'pseudosci.data') == []
+
+    def test_data(self):
+        """Importer le package de données ne construit aucune donnée."""
+        assert _loaded('import pseudosci.data', 'pseudosci.data.constants',
+                       'pseudosci.data.food', 'pseudosci.data.vehicles',
+                       'json') == []
+
+    def test_units(self):
+        """Importer les unités ne charge pas les modules optionnels."""
+        assert _loaded('import pseudosci.units', 'pseudosci.units.money',
+                       'pseudosci.units.arrays', 'pseudosci.units.store',
+                       'pseudosci.units.instrument', 'numpy') == []
+
+    def test_attribute(self):
+        """Les sous-modules et les données sont chargés au premier accès."""
+        assert _loaded('import pseudosci\npseudosci.data.PLANCK_MASS',
+                       'pseudosci.data.constants', 'pseudosci.data.food') \
+            == ['pseudosci.data.constants']
+
+    def test_values(self):
+        import pseudosci
+        from pseudosci import data
+        from pseudosci.data import constants
+        assert pseudosci.data is data
+        assert data.PLANCK_MASS is constants.PLANCK_MASS
+        assert 'lille_metro' in dir(data)
+        assert 'units' in dir(pseudosci)
+        with pytest.raises(AttributeError):
+            data.UNKNOWN
+        with pytest.raises(AttributeError):
+            pseudosci.unknown
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 
-from ..misc import movingavg, prefix
+from ..misc import movingavg, prefix, prefix_many, Prefixes
 from ..units import Unit
 import pytest
 
@@ -32,3 +32,47 @@ class TestMisc:
         assert prefix(DummyUnit(value=1000), {}) == "1000.0 units"
         with pytest.raises(ValueError):
             prefix(200)
+
+    def test_prefix_values(self):
+        """Test du préfixage des valeurs négatives et inférieures à un."""
+
+        class DummyUnit(Unit):
+            """Unité de test."""
+            fullname = "unit"
+            pluralname = "units"
+
+        assert prefix(DummyUnit(value=-1000)) == "-1.0 kilounit"
+        assert prefix(DummyUnit(value=-2500)) == "-2.5 kilounits"
+        assert prefix(DummyUnit(value=0.002)) == "2.0 milliunits"
+        assert prefix(DummyUnit(value=1e24)) == "1.0 yottaunit"
+        assert prefix(DummyUnit(value=999)) == "9.99 hectounits"
+        assert prefix(DummyUnit(value=0)) == str(DummyUnit(value=0))
+        assert prefix(DummyUnit(value=1e80)) == "1e+17 lumaunits"
+        binary = Prefixes({"": 1, "kibi": 1024, "mebi": 1024 ** 2})
+        assert binary.find(1000) == ("", 1)
+        assert binary.find(2048) == ("kibi", 1024)
+        assert binary.find(0.5) is None
+        assert prefix(DummyUnit(value=2048), binary) == "2.0 kibiunits"
+        with pytest.raises(ValueError):
+            Prefixes({"nothing": 0})
+
+    def test_prefix_many(self):
+        """Test du préfixage vectorisé."""
+        numpy = pytest.importorskip('numpy')
+        from ..units.arrays import UnitArray
+
+        class DummyUnit(Unit):
+            """Unité de test."""
+            fullname = "unit"
+            pluralname = "units"
+
+        values = [1, -1000, 0.002, 0, 999, 1e80, 1e-70, 2048, float('nan')]
+        for prefixes in (Prefixes(), Prefixes({"": 1, "kibi": 1024}),
+                         Prefixes({})):
+            units = UnitArray.of(DummyUnit).from_si(values)
+            assert prefix_many(units, prefixes) == \
+                [prefixes.format(DummyUnit(value=v)) for v in values]
+        powers = 10.0 ** numpy.arange(-70, 70)
+        assert Prefixes().indices(powers).tolist() == \
+            [Prefixes().index(v) for v in powers]
+        assert prefix_many([DummyUnit(value=1000)]) == ["1.0 kilounit"]
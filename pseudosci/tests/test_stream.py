@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+from itertools import count, islice
+from ..stream import Stream, convert, express, window, movingavg, chunks, \
+    unchunk, decimate
+from ..movement import AcceleratedMovement
+from ..units.general import Distance, Time, Velocity
+import pytest
+
+
+class TestStream:
+    """Tests des étapes de pseudosci.stream"""
+
+    def test_convert(self):
+        """Tests des conversions de flux."""
+        assert list(convert([1, 2], Distance, 'km')) == \
+            [Distance(km=1), Distance(km=2)]
+        assert list(express([Distance(km=1), Time(h=2)], 'm')) == [1000, 120]
+        with pytest.raises(ValueError):
+            list(convert([1], Distance, 'pouet'))
+
+    def test_window(self):
+        """Tests des fenêtres glissantes et de la décimation."""
+        assert list(window(range(5), 3)) == [(0, 1, 2), (1, 2, 3), (2, 3, 4)]
+        assert list(window(range(7), 2, 3)) == [(0, 1), (3, 4)]
+        assert list(decimate(range(7), 3)) == [0, 3, 6]
+        assert list(decimate(range(7), 3, 1)) == [1, 4]
+
+    def test_movingavg(self):
+        """Tests de la moyenne glissante."""
+        ly = [2, 4, 6, 8, 6, 5, 4, 5, 6, 8]
+        assert list(map(int, movingavg(ly, 3))) == [4, 6, 6, 6, 5, 4, 5, 6]
+        assert list(movingavg([Time(s=1), Time(s=3)], 2)) == [Time(s=2)]
+        with pytest.raises(TypeError):
+            list(movingavg([Time(s=1), Distance(m=3)], 2))
+
+    def test_chunks(self):
+        """Tests du regroupement en tableaux de flottants."""
+        distances = [Distance(m=i) for i in range(5)]
+        result = list(chunks(distances, 2))
+        assert [list(c) for c in result] == [[0, 1], [2, 3], [4]]
+        assert list(unchunk(result, Distance)) == distances
+        with pytest.raises(TypeError):
+            list(chunks([Distance(m=1), Time(s=1)]))
+
+    def test_pipeline(self):
+        """Tests de l'enchaînement paresseux sur un flux infini."""
+        stream = Stream(count(1)).convert(Distance, 'km').apply(
+            lambda d: AcceleratedMovement(distance=d, time=Time(s=10))) \
+            .apply(lambda m: m.velocity).select(lambda v: v.mps > 300) \
+            .decimate(2).express('mps')
+        assert list(islice(stream, 3)) == [400, 800, 1200]
+        speeds = Stream([Velocity(mps=v) for v in range(6)]).movingavg(2)
+        assert list(speeds.express('mps')) == [0.5, 1.5, 2.5, 3.5, 4.5]
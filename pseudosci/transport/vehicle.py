@@ -14,7 +14,7 @@ class Vehicle:
         self.brake = brake
         self.mass = mass
         if not accel:
-            self.accel = Acceleration(mpss=0)
+            self.accel = Acceleration.constant(mpss=0)
         if not brake:
             self.brake = self.accel
 
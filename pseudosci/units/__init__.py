@@ -1,14 +1,345 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """Unités de mesure du projet. Toutes les unités sont stockées en interne sous
-l'unité du système international."""
-
+l'unité du système international. Les conversions formées d'un préfixe du
+système international et du symbole d'une unité (`GJ`, `mV`, `kHz`) sont
+reconnues automatiquement."""
+
+from array import array
+from collections import OrderedDict
+from threading import Lock
+from operator import add, sub, mul, truediv, floordiv, lt, le, gt, ge
 from six import with_metaclass
 
+_new = object.__new__
+
+# Entrée d'index utilisée lorsqu'aucune conversion n'est disponible
+_NO_CONVERSION = (None, None)
+
+
+def _identity(value):
+    return value
+
+
+class Affine(object):
+    """Conversion affine d'une unité vers l'unité du système international :
+    `si = (valeur - origin) * scale + offset`. Les conversions linéaires
+    n'ont ni origine ni décalage. Les conversions affines peuvent être
+    composées et inversées, et s'appliquent aussi bien à des nombres qu'à
+    des tableaux NumPy."""
+    __slots__ = ('scale', 'offset', 'origin')
+
+    def __init__(self, scale, offset=0.0, origin=0.0):
+        self.scale = float(scale)
+        self.offset = float(offset)
+        self.origin = float(origin)
+
+    def __repr__(self):
+        return '<{0} (v - {1!r}) * {2!r} + {3!r}>'.format(
+            type(self).__name__, self.origin, self.scale, self.offset)
+
+    def __eq__(self, other):
+        if type(self) is type(other):
+            return (self.scale, self.offset, self.origin) == \
+                (other.scale, other.offset, other.origin)
+        return NotImplemented
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.scale, self.offset, self.origin))
+
+    @property
+    def linear(self):
+        """Indique si la conversion est une simple multiplication."""
+        return self.offset == 0 and self.origin == 0
+
+    def __call__(self, value):
+        """Convertir une valeur absolue vers l'unité du système
+        international."""
+        return (value - self.origin) * self.scale + self.offset
+
+    def inverse(self, value):
+        """Convertir une valeur absolue depuis l'unité du système
+        international."""
+        return (value - self.offset) / self.scale + self.origin
+
+    def delta(self, value):
+        """Convertir un écart de valeurs, auquel l'origine et le décalage ne
+        s'appliquent pas."""
+        return value * self.scale
+
+    def inverted(self):
+        """Obtenir la conversion réciproque."""
+        return Affine(1.0 / self.scale, self.origin, self.offset)
+
+    def then(self, other):
+        """Composer la conversion vers l'unité du système international avec
+        la conversion réciproque de `other`, pour convertir directement de
+        l'unité de départ vers l'unité d'arrivée de `other`."""
+        return Affine(self.scale / other.scale,
+                      (self.offset - other.offset) / other.scale +
+                      other.origin, self.origin)
+
+    def functions(self):
+        """Obtenir le couple de fonctions (vers SI, depuis SI) de la
+        conversion, réduites à un produit pour une conversion linéaire."""
+        (scale, offset, origin) = (self.scale, self.offset, self.origin)
+        if self.linear:
+            return (lambda v: v * scale, lambda v: v / scale)
+        return (lambda v: (v - origin) * scale + offset,
+                lambda v: (v - offset) / scale + origin)
+
+
+def _affine(conv):
+    """Obtenir la conversion affine correspondant à une entrée du
+    dictionnaire `convert` d'une unité, ou None si la conversion est
+    décrite par des fonctions."""
+    if isinstance(conv, Affine):
+        return conv
+    if isinstance(conv, (int, float)):
+        return Affine(conv)
+    return None
+
+
+def _converters(conv):
+    """Obtenir le couple de fonctions (vers SI, depuis SI) correspondant à une
+    entrée du dictionnaire `convert` d'une unité : un nombre, une conversion
+    affine ou un couple de fonctions. Une fonction manquante est remplacée
+    par None."""
+    affine = _affine(conv)
+    if affine is not None:
+        return affine.functions()
+    tosi = conv[0] if callable(conv[0]) else None
+    fromsi = conv[1] if type(conv) is tuple and len(conv) == 2 \
+        and callable(conv[1]) else None
+    return (tosi, fromsi)
+
+
+class ConversionTable(dict):
+    """Dictionnaire `convert` d'une unité. Toute modification reconstruit
+    l'index de conversion de l'unité qui le possède."""
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.owner = None
+
+    def _changed(self):
+        if self.owner is not None:
+            self.owner._build_index()
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        value = dict.setdefault(self, key, default)
+        self._changed()
+        return value
+
+    def pop(self, *args):
+        value = dict.pop(self, *args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = dict.popitem(self)
+        self._changed()
+        return item
+
+    def clear(self):
+        dict.clear(self)
+        self._changed()
+
+
+class ConversionAttribute(object):
+    """Descripteur installé sur une unité pour chaque clé de son dictionnaire
+    `convert` et pour chaque nom préfixé de son symbole. La lecture convertit
+    la valeur vers l'unité correspondante, l'écriture la convertit vers
+    l'unité du système international."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        conv = (owner._converters.get(self.name) or
+                owner._prefix(self.name))[1]
+        if conv is None:
+            raise AttributeError("{0} object has no attribute {1}".format(
+                owner.__name__, self.name))
+        return conv(instance.value)
+
+    def __set__(self, instance, value):
+        owner = type(instance)
+        conv = (owner._converters.get(self.name) or
+                owner._prefix(self.name))[0]
+        if conv is None:
+            raise AttributeError("Cannot set {0} on {1} object".format(
+                self.name, type(instance).__name__))
+        _set_value(instance, conv(value))
+
+
+def _dimension_key(dimension):
+    """Obtenir la forme canonique, hashable, d'un vecteur de dimension donné
+    sous forme de dictionnaire associant une dimension de base à son
+    exposant. Les exposants nuls sont ignorés."""
+    return tuple(sorted((base, exp) for (base, exp) in dimension.items()
+                        if exp))
+
+
+def _combine(left, right, sign):
+    """Combiner deux vecteurs de dimension canoniques : `sign` vaut 1 pour
+    un produit et -1 pour un quotient."""
+    exps = dict(left)
+    for (base, exp) in right:
+        exps[base] = exps.get(base, 0) + sign * exp
+    return _dimension_key(exps)
+
+
+def _dimension_symbol(key):
+    """Représenter un vecteur de dimension canonique à l'aide des symboles
+    des unités de base du système international, par exemple kg.m.s^-2."""
+    order = [base for (base, symbol) in BASE_DIMENSIONS]
+    exps = sorted(key, key=lambda item: (
+        order.index(item[0]) if item[0] in order else len(order), item[0]))
+    symbols = dict(BASE_DIMENSIONS)
+    return '.'.join(symbols.get(base, base) +
+                    ('' if exp == 1 else '^{0}'.format(exp))
+                    for (base, exp) in exps)
+
+
+# Préfixes du système international, applicables au symbole d'une unité
+SI_PREFIXES = {
+    'Y': 1e24, 'Z': 1e21, 'E': 1e18, 'P': 1e15, 'T': 1e12, 'G': 1e9,
+    'M': 1e6, 'k': 1e3, 'h': 1e2, 'da': 1e1, 'd': 1e-1, 'c': 1e-2,
+    'm': 1e-3, 'u': 1e-6, 'µ': 1e-6, 'n': 1e-9, 'p': 1e-12, 'f': 1e-15,
+    'a': 1e-18, 'z': 1e-21, 'y': 1e-24
+}
+
+# Opérations arithmétiques binaires : fonction et opérandes inversés ou non
+_OPERATORS = {
+    'add': (add, False), 'sub': (sub, False), 'rsub': (sub, True),
+    'mul': (mul, False), 'truediv': (truediv, False),
+    'floordiv': (floordiv, False), 'rtruediv': (truediv, True),
+    'rfloordiv': (floordiv, True)
+}
+
+# Cache des opérations, associant à un triplet (type de l'unité, type de
+# l'opérande, nom de l'opération) la fonction réalisant l'opération. Les
+# puissances sont mémorisées par exposant ; le cache est vidé lorsqu'il
+# atteint `OPERATIONS_SIZE` éléments.
+_OPERATIONS = {}
+OPERATIONS_SIZE = 4096
+
+
+def _not_implemented(unit, other):
+    return NotImplemented
+
+
+def _resolve(name, left, right):
+    """Obtenir le constructeur du résultat de l'opération `name` entre une
+    unité de type `left` et un opérande de type `right`, ou None si
+    l'opération n'est pas possible. Les constantes sont traitées comme les
+    unités dont elles sont issues."""
+    left = left._unit
+    right = getattr(right, '_unit', right)
+    scalar = issubclass(right, (int, float))
+    if scalar and name in ('rtruediv', 'rfloordiv'):
+        return left._result(None, -1)
+    elif scalar or issubclass(right, left) and \
+            name in ('add', 'sub', 'rsub'):
+        return left.from_si
+    elif issubclass(right, left) and name in ('truediv', 'floordiv'):
+        return float
+    elif issubclass(right, Unit) and name == 'mul':
+        return left._result(right, 1)
+    elif issubclass(right, Unit) and name in ('truediv', 'floordiv'):
+        return left._result(right, -1)
+    return None
+
+
+def _dispatch(key):
+    """Résoudre et mémoriser la fonction réalisant une opération pour un
+    triplet (type de l'unité, type de l'opérande, nom de l'opération)."""
+    (left, right, name) = key
+    (func, reflected) = _OPERATORS[name]
+    scalar = issubclass(right, (int, float))
+    build = _resolve(name, left, right)
+    if build is None:
+        operation = _not_implemented
+    elif scalar and reflected:
+        def operation(unit, other):
+            return build(func(other, unit.value))
+    elif scalar:
+        def operation(unit, other):
+            return build(func(unit.value, other))
+    elif reflected:
+        def operation(unit, other):
+            return build(func(other.value, unit.value))
+    else:
+        def operation(unit, other):
+            return build(func(unit.value, other.value))
+    _OPERATIONS[key] = operation
+    return operation
+
+
+def _operator(name):
+    """Générer la méthode d'une unité réalisant l'opération binaire `name`.
+    Chaque combinaison de types n'est résolue qu'une seule fois."""
+    def method(self, other):
+        key = (type(self), type(other), name)
+        operation = _OPERATIONS.get(key)
+        if operation is None:
+            operation = _dispatch(key)
+        return operation(self, other)
+    method.__name__ = '__{0}__'.format(name)
+    return method
+
+
+def _same_unit(unit, other):
+    """Indiquer si `other` est une unité de même type que `unit`, l'une ou
+    l'autre pouvant être une constante."""
+    return type(unit) is type(other) or isinstance(other, Unit) and \
+        type(unit)._unit is type(other)._unit
+
+
+def _comparison(compare):
+    """Générer la méthode d'une unité réalisant la comparaison `compare`
+    entre deux unités de même type."""
+    def method(self, other):
+        if _same_unit(self, other):
+            return compare(self.value, other.value)
+        return NotImplemented
+    method.__name__ = '__{0}__'.format(compare.__name__)
+    return method
+
+
+# Dimensions de base et symboles des unités correspondantes du système
+# international. Toute autre chaîne peut servir de dimension de base.
+BASE_DIMENSIONS = (('M', 'kg'), ('L', 'm'), ('T', 's'), ('I', 'A'),
+                   ('K', 'K'), ('N', 'mol'), ('J', 'cd'), ('A', 'rad'))
+
 
 class UnitBase(type):
     """Métaclasse servant à la création d'unités."""
     units = {}
+    # Incrémenté à chaque modification des conversions d'une unité
+    revision = 0
+    # Index associant un vecteur de dimension canonique à son unité
+    dimensions = {}
+    # Fonctions appelées avec chaque nouvelle unité
+    hooks = []
 
     def __new__(cls, name, bases, attrs):
         if name not in ["Unit", "NewBase"] and \
@@ -21,36 +352,63 @@ class UnitBase(type):
             l'unité de mesure standard. `value` désigne la valeur à convertir
             et `source` est une chaîne de caractères représentant l'unité,
             appartenant à l'attribut `convert` de l'unité."""
-            if source.lower() == 'value':
-                return value
-            for (name, conv) in self.convert.items():
-                if source.lower() == name.lower():
-                    if isinstance(conv, (int, float)):
-                        return value * conv
-                    elif callable(conv[0]):
-                        return conv[0](value)
-            raise ValueError("Cannot convert {0} {1} to {2}".format(
+            conv = type(self)._conversion(source)[0]
+            if conv is None:
+                raise ValueError("Cannot convert {0} {1} to {2}".format(
                     value, source, self.pluralname))
+            return conv(value)
 
         def _convertto(self, dest):
             """Convertir l'unité de mesure standard en une autre unité.
             `value` désigne la valeur à convertir et `dest` est une chaîne de
             caractères représentant l'unité souhaitées, présent parmi les clés
             du dictionnaire `convert` de l'instance."""
-            if dest.lower() == 'value':
-                return self.value
-            for (name, conv) in self.convert.items():
-                if dest.lower() == name.lower():
-                    if isinstance(conv, (int, float)):
-                        return self.value / conv
-                    elif type(conv) is tuple and len(conv) == 2 \
-                            and callable(conv[1]):
-                        return conv[1](self.value)
-            raise ValueError("Cannot convert {0} to {1}".format(self, dest))
+            conv = type(self)._conversion(dest)[1]
+            if conv is None:
+                raise ValueError("Cannot convert {0} to {1}".format(
+                    self, dest))
+            return conv(self.value)
+
+        def _from_si(cls, value):
+            """Instancier l'unité directement à partir d'une valeur flottante
+            exprimée dans l'unité du système international, sans analyse des
+            paramètres nommés."""
+            unit = _new(cls)
+            _set_value(unit, value)
+            return unit
+
+        def _constant(cls, **kwargs):
+            """Obtenir une instance immuable et partagée de l'unité. Les
+            instances sont mémorisées par valeur, dans la limite de
+            `INTERNED_SIZE` valeurs récemment demandées."""
+            (name, value), = kwargs.items()
+            unit = _new(cls)
+            value = _convertfrom(unit, float(value), str(name))
+            return _intern(cls, value)
+
+        def _convert_many(cls, values, src='value', dst='value'):
+            """Convertir en une passe une séquence, un tableau ou un buffer
+            de valeurs de l'unité `src` vers l'unité `dst`, sans instancier
+            d'unités. Renvoie un tableau NumPy si `values` en est un, et un
+            tableau `array('d')` sinon. Les conversions affines sont
+            composées en une unique conversion."""
+            tosi = cls._conversion(src)[0]
+            fromsi = cls._conversion(dst)[1]
+            if tosi is None or fromsi is None:
+                raise ValueError("Cannot convert {0} to {1}".format(src, dst))
+            affine = cls.affine(src, dst)
+            if affine is not None:
+                convert = affine.functions()[0]
+            else:
+                def convert(v):
+                    return fromsi(tosi(v))
+            if hasattr(values, '__array_interface__'):  # Tableau NumPy
+                return convert(values.astype(float))
+            return array('d', [convert(v) for v in values])
 
         def _init(self, **kwargs):
             (name, value), = kwargs.items()
-            self.value = self.convertfrom(float(value), str(name))
+            _set_value(self, self.convertfrom(float(value), str(name)))
 
         def _str(self): return '{0} {1}'.format(
             str(self.value), self.fullname
@@ -59,132 +417,375 @@ class UnitBase(type):
         def _repr(self): return '<{0} {1}>'.format(type(self).__name__, self)
 
         def _getattr(self, name):
-            try:
-                return self.convertto(name)
-            except ValueError as v:
+            if name == 'value':  # Valeur non initialisée
+                raise AttributeError("{0} object has no value".format(
+                    self.__class__.__name__))
+            conv = type(self)._conversion(name)[1]
+            if conv is None:
                 raise AttributeError("{0} object has no attribute {1}".format(
                     self.__class__.__name__, name))
+            return conv(self.value)
 
-        def _setattr(self, name, value):
-            try:
-                object.__setattr__(self, 'value',
-                                   self.convertfrom(value, name))
-            except ValueError as v:
-                object.__setattr__(self, name, value)
+        def _reduce(self): return (loads, (dumps(self), ))
 
         def _int(self): return int(self.value)
 
         def _float(self): return float(self.value)
 
-        def _abs(self): return type(self)(value=abs(self.value))
-
-        def _pos(self): return type(self)(value=+self.value)
-
-        def _neg(self): return type(self)(value=-self.value)
-
-        def _add(self, other):
-            if isinstance(other, type(self)):
-                return type(self)(value=self.value + other.value)
-            elif isinstance(other, (int, float)):
-                return type(self)(value=self.value + other)
-            return NotImplemented
-
-        def _sub(self, other):
-            if isinstance(other, type(self)):
-                return type(self)(value=self.value - other.value)
-            elif isinstance(other, (int, float)):
-                return type(self)(value=self.value - other)
-            return NotImplemented
-
-        def _rsub(self, other):
-            if isinstance(other, type(self)):
-                return type(self)(value=other.value - self.value)
-            elif isinstance(other, (int, float)):
-                return type(self)(value=other - self.value)
-            return NotImplemented
-
-        def _mul(self, other):
-            if isinstance(other, (int, float)):
-                return type(self)(value=self.value * other)
-            elif isinstance(other, Unit) and \
-                    other.__class__.__name__ in self.multiply:
-                return UnitBase.units[self.multiply[other.__class__.__name__]](
-                    value=self.value * other.value)
-            return NotImplemented
-
-        def _div(self, other):
-            if isinstance(other, type(self)):
-                return self.value / other.value
-            elif isinstance(other, (int, float)):
-                return type(self)(value=self.value / other)
-            elif isinstance(other, Unit) and \
-                    other.__class__.__name__ in self.divide:
-                return UnitBase.units[self.divide[other.__class__.__name__]](
-                    value=self.value / other.value)
-            return NotImplemented
+        def _abs(self): return type(self).from_si(abs(self.value))
 
-        def _floordiv(self, other):
-            if isinstance(other, type(self)):
-                return self.value // other.value
-            elif isinstance(other, (int, float)):
-                return type(self)(value=self.value // other)
-            elif isinstance(other, Unit) and \
-                    other.__class__.__name__ in self.divide:
-                return UnitBase.units[self.divide[other.__class__.__name__]](
-                    value=self.value // other.value)
-            return NotImplemented
+        def _pos(self): return type(self).from_si(+self.value)
 
-        def _rdiv(self, other):
-            if hasattr(self, 'inverse'):
-                return UnitBase.units[self.inverse](value=other / self.value)
-            return NotImplemented
-
-        def _rfloordiv(self, other):
-            if hasattr(self, 'inverse'):
-                return UnitBase.units[self.inverse](value=other // self.value)
-            return NotImplemented
+        def _neg(self): return type(self).from_si(-self.value)
 
         def _pow(self, other):
-            if not isinstance(other, int):
+            if not isinstance(other, (int, float)):
                 return NotImplemented
-            if other > 1:  # [1, infinity]
-                return self ** (other - 1) * self
-            elif other < 0:  # [-infinity, 0]
-                return (1 / self) ** abs(other)
-            return 1 if other == 0 else self  # [0, 1]
+            key = (type(self), other, 'pow')
+            build = _OPERATIONS.get(key)
+            if build is None:
+                # Les exposants invalides lèvent une erreur avant d'être
+                # mémorisés ; le cache est vidé s'il devient trop grand
+                build = type(self)._power(other)
+                if len(_OPERATIONS) >= OPERATIONS_SIZE:
+                    _OPERATIONS.clear()
+                _OPERATIONS[key] = build
+            value = self.value ** other
+            if isinstance(value, complex):
+                raise ValueError("Cannot raise negative {0} to the power "
+                                 "{1}".format(type(self).__name__, other))
+            return build(value)
+
+        def _sqrt(self):
+            """Racine carrée de l'unité, si sa dimension le permet."""
+            return self ** 0.5
 
         def _eq(self, other):
-            if type(self) is type(other):
+            if _same_unit(self, other):
                 return self.value == other.value
             return NotImplemented
 
         def _ne(self, other): return not self == other
 
+        # Le hachage dépend de la valeur, qui peut être modifiée : une unité
+        # ne doit pas l'être tant qu'elle est dans un ensemble ou sert de
+        # clé de dictionnaire. Les constantes n'ont pas cette limitation.
+        def _hash(self): return hash(self.value)
+
         defaultattrs = {
-            'convert': {'unit': 1, 'u': 1, 'units': 1}, 'value': 0.0,
+            'convert': {'unit': 1, 'u': 1, 'units': 1}, '__slots__': (),
             'convertto': _convertto, 'convertfrom': _convertfrom,
-            'divide': {}, 'multiply': {},
+            'from_si': classmethod(_from_si),
+            'constant': classmethod(_constant),
+            'convert_many': classmethod(_convert_many),
+            'dimension': None, 'symbol': None, '_derived': False,
             '__init__': _init, '__str__': _str, '__repr__': _repr,
-            '__getattr__': _getattr, '__setattr__': _setattr, '__int__': _int,
+            '__getattr__': _getattr,
+            '__reduce__': _reduce, '__int__': _int,
             '__float__': _float, '__abs__': _abs, '__pos__': _pos,
-            '__neg__': _neg, '__add__': _add, '__radd__': _add,
-            '__sub__': _sub, '__rsub__': _rsub, '__mul__': _mul,
-            '__rmul__': _mul, '__div__': _div, '__truediv__': _div,
-            '__floordiv__': _floordiv, '__rdiv__': _rdiv,
-            '__rtruediv__': _rdiv, '__rfloordiv__': _rfloordiv,
-            '__pow__': _pow, '__eq__': _eq, '__ne__': _ne
+            '__neg__': _neg, '__add__': _operator('add'),
+            '__radd__': _operator('add'), '__sub__': _operator('sub'),
+            '__rsub__': _operator('rsub'), '__mul__': _operator('mul'),
+            '__rmul__': _operator('mul'), '__div__': _operator('truediv'),
+            '__truediv__': _operator('truediv'),
+            '__floordiv__': _operator('floordiv'),
+            '__rdiv__': _operator('rtruediv'),
+            '__rtruediv__': _operator('rtruediv'),
+            '__rfloordiv__': _operator('rfloordiv'),
+            '__pow__': _pow, 'sqrt': _sqrt, '__eq__': _eq, '__ne__': _ne,
+            '__hash__': _hash, '__lt__': _comparison(lt),
+            '__le__': _comparison(le), '__gt__': _comparison(gt),
+            '__ge__': _comparison(ge)
         }
 
         for k, v in defaultattrs.items():
             if k not in attrs:
                 attrs[k] = v
+        attrs['convert'] = ConversionTable(attrs['convert'])
         return type.__new__(cls, name, bases, attrs)
 
     def __init__(cls, name, bases, attrs):
+        cls.convert.owner = cls
+        # Unité dont les instances de la classe relèvent ; les sous-classes
+        # des constantes en héritent
+        cls._unit = cls
+        cls._build_index()
+        cls._dimension = None if cls.dimension is None \
+            else _dimension_key(cls.dimension)
         if name != "Unit":  # Subclass of Unit
             UnitBase.units[cls.__name__] = cls
+            known = UnitBase.dimensions.get(cls._dimension)
+            if cls._dimension is not None and \
+                    (known is None or known._derived):
+                UnitBase.dimensions[cls._dimension] = cls
+                # Des opérations résolues vers une unité dérivée ont pu
+                # être mémorisées
+                _OPERATIONS.clear()
+        for hook in UnitBase.hooks:
+            hook(cls)
+
+    def __setattr__(cls, name, value):
+        if name == 'convert':
+            value = ConversionTable(value)
+            value.owner = cls
+        type.__setattr__(cls, name, value)
+        if name == 'convert':
+            cls._build_index()
+
+    @staticmethod
+    def instrumented():
+        """Obtenir un gestionnaire de contexte comptant, le temps d'un bloc
+        `with`, les appels des méthodes des unités par classe et par
+        opération. Voir pseudosci.units.instrument."""
+        from .instrument import Instrumentation
+        return Instrumentation()
+
+    @staticmethod
+    def quantity(dimension):
+        """Obtenir l'unité correspondant à un vecteur de dimension, sous forme
+        de dictionnaire ou canonique. Une unité dérivée anonyme est créée si
+        aucune unité nommée ne correspond ; une dimension nulle correspond au
+        type `float`."""
+        if isinstance(dimension, dict):
+            dimension = _dimension_key(dimension)
+        if not dimension:
+            return float
+        unit = UnitBase.dimensions.get(dimension)
+        if unit is None:
+            symbol = _dimension_symbol(dimension)
+            unit = UnitBase('Derived[{0}]'.format(symbol), (Unit, ), {
+                '__doc__': "Unité dérivée anonyme ({0}).".format(symbol),
+                'fullname': symbol, 'pluralname': symbol,
+                'dimension': dict(dimension),
+                '_derived': True})
+        return unit
+
+    def _result(cls, other, sign):
+        """Obtenir le constructeur du résultat d'un produit (`sign` vaut 1)
+        ou d'un quotient (`sign` vaut -1) de l'unité par une autre unité, ou
+        par un nombre si `other` vaut None. Renvoie None si l'une des unités
+        n'a pas de dimension."""
+        if cls._dimension is None:
+            return None
+        if other is None:
+            dimension = _combine((), cls._dimension, sign)
+        elif other._dimension is None:
+            return None
+        else:
+            dimension = _combine(cls._dimension, other._dimension, sign)
+        unit = cls.quantity(dimension)
+        return float if unit is float else unit.from_si
+
+    def _power(cls, exponent):
+        """Obtenir le constructeur du résultat de l'élévation de l'unité à une
+        puissance donnée. Les exposants de la dimension obtenue doivent être
+        entiers. Une unité sans dimension ne peut être élevée qu'aux
+        puissances 0 et 1."""
+        if cls._dimension is None:
+            if exponent not in (0, 1):
+                raise ValueError("Cannot raise {0} to the power {1}".format(
+                    cls.__name__, exponent))
+            return float if exponent == 0 else cls.from_si
+        dimension = {}
+        for (base, exp) in cls._dimension:
+            power = exp * exponent
+            if abs(power - round(power)) > 1e-9:
+                raise ValueError("Cannot raise {0} to the power {1}".format(
+                    cls.__name__, exponent))
+            dimension[base] = int(round(power))
+        unit = cls.quantity(dimension)
+        return float if unit is float else unit.from_si
+
+    def _build_index(cls):
+        """Construire l'index des conversions de l'unité : à chaque nom de
+        conversion en minuscules est associé un couple de fonctions de
+        conversion vers et depuis l'unité du système international. Les
+        conversions affines et les facteurs des conversions linéaires sont
+        également indexés."""
+        (index, affines, factors) = ({}, {}, {})
+        for (name, conv) in cls.convert.items():
+            if name.lower() in index:
+                continue
+            index[name.lower()] = _converters(conv)
+            affine = _affine(conv)
+            if affine is not None:
+                affines[name.lower()] = affine
+                if affine.linear:
+                    factors[name.lower()] = affine.scale
+        index['value'] = (_identity, _identity)
+        affines['value'] = Affine(1.0)
+        factors['value'] = 1.0
+        cls._affines = affines
+        cls._factors = factors
+        cls._prefixed = {}
+        cls._converters = index
+        UnitBase.revision += 1
+        cls._install_attributes()
+
+    def _prefix(cls, name):
+        """Résoudre un nom de conversion formé d'un préfixe du système
+        international suivi du symbole de l'unité, par exemple `GJ` ou `mV`.
+        Le préfixe respecte la casse, contrairement au symbole. Le résultat
+        est mémorisé et comporte en troisième élément le facteur de
+        conversion ; renvoie un couple de None si le nom n'est pas
+        reconnu."""
+        conv = cls._prefixed.get(name)
+        if conv is not None:
+            return conv
+        symbol = cls.symbol
+        if not symbol or not name.lower().endswith(symbol.lower()):
+            return _NO_CONVERSION
+        prefix = SI_PREFIXES.get(name[:-len(symbol)])
+        base = cls._factors.get(symbol.lower())
+        if prefix is None or base is None:
+            return _NO_CONVERSION
+        factor = prefix * base
+        conv = cls._prefixed[name] = \
+            (lambda v: v * factor, lambda v: v / factor, factor)
+        return conv
+
+    def _conversion(cls, name):
+        """Obtenir le couple de fonctions de conversion (vers SI, depuis SI)
+        correspondant à un nom de conversion, éventuellement préfixé. Les
+        clés du dictionnaire `convert` l'emportent, sans tenir compte de la
+        casse ; seuls les noms qui n'en sont pas sont résolus comme préfixe
+        suivi du symbole de l'unité."""
+        return cls._converters.get(name.lower()) or cls._prefix(name)
+
+    def _factor(cls, name):
+        """Obtenir le facteur d'une conversion linéaire, ou None."""
+        if name.lower() in cls._converters:
+            return cls._factors.get(name.lower())
+        conv = cls._prefix(name)
+        return conv[2] if len(conv) > 2 else None
+
+    def _affine_conversion(cls, name):
+        """Obtenir la conversion affine correspondant à un nom de conversion,
+        éventuellement préfixé, ou None."""
+        if name.lower() in cls._converters:
+            return cls._affines.get(name.lower())
+        factor = cls._factor(name)
+        return None if factor is None else Affine(factor)
+
+    def affine(cls, src, dst='value'):
+        """Obtenir la conversion affine directe de l'unité `src` vers l'unité
+        `dst`, calculée sans passer par l'unité du système international, ou
+        None si l'une des conversions n'est pas affine. Sa méthode `delta`
+        convertit les écarts de valeurs :
+        `Temperature.affine('f', 'c').delta(18) == 10`."""
+        (source, dest) = (cls._affine_conversion(src),
+                          cls._affine_conversion(dst))
+        if source is None or dest is None:
+            return None
+        return source.then(dest)
+
+    def _install_attributes(cls):
+        """Installer un descripteur ConversionAttribute pour chaque clé du
+        dictionnaire `convert`, sous son nom d'origine, en minuscules, en
+        majuscules et capitalisé, ainsi que pour chaque préfixe du système
+        international suivi du symbole de l'unité, sans masquer les autres
+        attributs de la classe. Un nom préfixé qui est aussi une clé désigne
+        la clé. Les descripteurs dont la conversion a disparu sont
+        retirés."""
+        names = set()
+        for name in cls.convert:
+            names.update((name, name.lower(), name.upper(),
+                          name.capitalize()))
+        symbol = cls.symbol
+        if symbol and symbol.lower() in cls._factors:
+            for prefix in SI_PREFIXES:
+                names.update((prefix + symbol, prefix + symbol.lower()))
+        names.discard('value')
+        for (name, attr) in list(vars(cls).items()):
+            if isinstance(attr, ConversionAttribute) and name not in names:
+                type.__delattr__(cls, name)
+        for name in names:
+            attr = getattr(cls, name, _NO_CONVERSION)
+            if attr is _NO_CONVERSION or isinstance(attr, ConversionAttribute):
+                key = name.lower()
+                type.__setattr__(cls, name, ConversionAttribute(
+                    key if key in cls._converters else name))
 
 
 class Unit(with_metaclass(UnitBase)):
-    """Classe abstraite d'unité de base."""
-    pass
+    """Classe abstraite d'unité de base. Les instances ne possèdent qu'un
+    unique attribut, `value`, la valeur dans l'unité du système
+    international. Elles sont hachées selon cette valeur : une unité
+    modifiée après avoir été placée dans un ensemble ou utilisée comme clé
+    de dictionnaire n'y est plus retrouvée ; préférez-y les constantes
+    obtenues par `Unit.constant`."""
+    __slots__ = ('value', )
+
+
+# Accès direct à la valeur des instances, sans passer par __setattr__
+_set_value = Unit.value.__set__
+
+# Nombre maximal de constantes mémorisées par Unit.constant
+INTERNED_SIZE = 1024
+_INTERNED = OrderedDict()
+_INTERNED_LOCK = Lock()
+
+
+# Sous-classes immuables des unités, associées à leur unité
+_CONSTANTS = {}
+
+
+def _frozen_setattr(self, name, value):
+    raise AttributeError("Cannot modify a constant {0}".format(
+        type(self).__name__))
+
+
+def _constant_class(cls):
+    """Obtenir la sous-classe immuable de l'unité `cls`, dont les instances
+    sont les constantes de l'unité. Elle n'est pas enregistrée parmi les
+    unités : ses instances se comparent, se combinent et se sérialisent
+    comme celles de `cls`, et les résultats des opérations sont des
+    instances de `cls`."""
+    frozen = _CONSTANTS.get(cls)
+    if frozen is None:
+        frozen = _CONSTANTS[cls] = type.__new__(type(cls), cls.__name__, (
+            cls, ), {'__doc__': cls.__doc__, '__module__': cls.__module__,
+                     '__slots__': (), '__setattr__': _frozen_setattr,
+                     'from_si': cls.from_si})
+    return frozen
+
+
+def _intern(cls, value):
+    """Obtenir l'instance immuable partagée de l'unité `cls` de valeur
+    `value`, en la créant si nécessaire. Les valeurs les moins récemment
+    demandées sont oubliées au-delà de `INTERNED_SIZE` valeurs."""
+    cls = cls._unit
+    key = (cls, value)
+    with _INTERNED_LOCK:
+        unit = _INTERNED.pop(key, None)
+        if unit is None:
+            unit = _new(_constant_class(cls))
+            _set_value(unit, value)
+            while len(_INTERNED) >= INTERNED_SIZE:
+                _INTERNED.popitem(last=False)
+        _INTERNED[key] = unit
+    return unit
+
+
+from .parser import parse  # noqa: E402
+from .kernels import boundary  # noqa: E402
+# min et max sont exportés sous les noms umin et umax pour ne pas masquer
+# les fonctions natives lors d'un `from pseudosci.units import *`
+from .reductions import usum, mean, weighted_mean, \
+    min as umin, max as umax  # noqa: E402
+from .index import UnitIndex  # noqa: E402
+from .serial import dumps, loads  # noqa: E402
+
+# Sous-modules reposant sur des dépendances optionnelles, importés à leur
+# première utilisation
+_OPTIONAL = ('arrays', 'expression', 'instrument', 'money', 'store')
+
+
+def __getattr__(name):
+    """Importer un sous-module optionnel lors du premier accès à l'attribut
+    correspondant (Python 3.7 et ultérieurs)."""
+    if name in _OPTIONAL:
+        import importlib
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(
+        __name__, name))
@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Tableaux de mesures d'une même unité, stockés dans un unique tableau
+contigu de flottants exprimés dans l'unité du système international.
+Le package Python `numpy` est requis."""
+
+import numpy
+from operator import eq, ne, lt, le, gt, ge
+from . import Unit, _OPERATORS, _OPERATIONS, _resolve, dumps, loads
+
+
+def _result(name, left, right):
+    """Obtenir le constructeur d'unité du résultat d'une opération,
+    comme pour les instances d'unités. Il est mémorisé dans le cache des
+    opérations des unités, sous le nom de l'opération préfixé de `array`,
+    et oublié avec lui lorsqu'une unité nommée est définie."""
+    key = (left, right, 'array ' + name)
+    if key not in _OPERATIONS:
+        _OPERATIONS[key] = _resolve(name, left, right)
+    return _OPERATIONS[key]
+
+
+def _wrap(build, values):
+    """Envelopper un tableau de valeurs dans le type de tableau correspondant
+    au constructeur d'unité `build`. Les résultats sans dimension restent de
+    simples tableaux NumPy."""
+    if build is float:
+        return values
+    return UnitArray.of(build.__self__).from_si(values)
+
+
+class UnitArray(object):
+    """Classe abstraite de tableau de mesures. Utilisez `UnitArray.of(unité)`
+    pour obtenir le type de tableau d'une unité, puis instanciez-le comme
+    l'unité elle-même : `UnitArray.of(Distance)(km=[1, 2, 3])`."""
+    __slots__ = ('values', )
+    # Unité des éléments du tableau, définie par les classes spécialisées
+    unit = None
+    # Types de tableaux déjà créés, par unité
+    types = {}
+    # Les opérations avec des tableaux NumPy sont déléguées au tableau
+    __array_ufunc__ = None
+
+    @staticmethod
+    def of(unit):
+        """Obtenir le type de tableau correspondant à une unité."""
+        if unit not in UnitArray.types:
+            UnitArray.types[unit] = type(
+                '{0}Array'.format(unit.__name__), (UnitArray, ),
+                {'__slots__': (), 'unit': unit,
+                 '__doc__': "Tableau de mesures de type {0}.".format(
+                     unit.__name__)})
+        return UnitArray.types[unit]
+
+    def __init__(self, **kwargs):
+        (name, values), = kwargs.items()
+        conv = self.unit._conversion(str(name))[0]
+        if conv is None:
+            raise ValueError("Cannot convert {0} to {1}".format(
+                name, self.unit.pluralname))
+        self.values = conv(numpy.asarray(values, dtype=numpy.float64))
+
+    @classmethod
+    def from_si(cls, values):
+        """Instancier le tableau à partir de valeurs exprimées dans l'unité
+        du système international, sans copie si possible."""
+        array = object.__new__(cls)
+        array.values = numpy.asarray(values, dtype=numpy.float64)
+        return array
+
+    @classmethod
+    def from_units(cls, units):
+        """Instancier le tableau à partir d'une séquence d'unités. Une
+        TypeError est levée si l'une d'elles n'est pas de l'unité du
+        tableau."""
+        unit = cls.unit
+
+        def values():
+            for element in units:
+                if type(element) is not unit and \
+                        getattr(type(element), '_unit', None) is not unit:
+                    raise TypeError("Expected {0} values, got {1}".format(
+                        unit.__name__, type(element).__name__))
+                yield element.value
+        return cls.from_si(numpy.fromiter(values(), dtype=numpy.float64))
+
+    def __getattr__(self, name):
+        if name == 'values':  # Valeurs non initialisées
+            raise AttributeError("{0} object has no values".format(
+                type(self).__name__))
+        conv = self.unit._conversion(name)[1]
+        if conv is None:
+            raise AttributeError("{0} object has no attribute {1}".format(
+                type(self).__name__, name))
+        return conv(self.values)
+
+    def __setattr__(self, name, value):
+        if name == 'values':
+            object.__setattr__(self, name, value)
+            return
+        conv = self.unit._conversion(name)[0]
+        if conv is None:
+            raise AttributeError("Cannot set {0} on {1} object".format(
+                name, type(self).__name__))
+        self.values = conv(numpy.asarray(value, dtype=numpy.float64))
+
+    def __reduce__(self):
+        return (loads, (dumps(self), ))
+
+    def __repr__(self):
+        return '<{0} {1} {2}>'.format(
+            type(self).__name__, self.values, self.unit.pluralname)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        from_si = self.unit.from_si
+        for value in self.values.tolist():
+            yield from_si(value)
+
+    def __getitem__(self, key):
+        values = self.values[key]
+        if numpy.ndim(values) == 0:
+            return self.unit.from_si(float(values))
+        return type(self).from_si(values)
+
+    def __setitem__(self, key, value):
+        values = self._same(value)
+        if values is None:
+            raise TypeError("Expected {0} values, got {1}".format(
+                self.unit.__name__, type(value).__name__))
+        self.values[key] = values
+
+    def _same(self, other):
+        """Obtenir les valeurs d'un opérande de même unité que le tableau, ou
+        None si l'opérande est d'un autre type."""
+        if isinstance(other, UnitArray) and other.unit is self.unit:
+            return other.values
+        elif isinstance(other, self.unit):
+            return other.value
+        return None
+
+    def _compare(self, other, func):
+        """Comparer le tableau élément par élément à un opérande de même
+        unité, et obtenir un tableau NumPy de booléens."""
+        values = self._same(other)
+        if values is None:
+            return NotImplemented
+        return func(self.values, values)
+
+    def _binary(self, other, name):
+        """Réaliser l'opération binaire `name` avec un opérande quelconque :
+        nombre, tableau NumPy, unité ou tableau d'unités."""
+        (func, reflected) = _OPERATORS[name]
+        if isinstance(other, UnitArray):
+            (right, values) = (other.unit, other.values)
+        elif isinstance(other, Unit):
+            (right, values) = (type(other), other.value)
+        elif isinstance(other, (int, float, numpy.number, numpy.ndarray)):
+            (right, values) = (float, other)
+        else:
+            return NotImplemented
+        if reflected and right is not float:
+            # Opération réfléchie entre unités : résolue depuis l'opérande
+            build = _result(name[1:], right, self.unit)
+        else:
+            build = _result(name, self.unit, right)
+        if build is None:
+            return NotImplemented
+        if reflected:
+            return _wrap(build, func(values, self.values))
+        return _wrap(build, func(self.values, values))
+
+    def __add__(self, other):
+        return self._binary(other, 'add')
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._binary(other, 'sub')
+
+    def __rsub__(self, other):
+        return self._binary(other, 'rsub')
+
+    def __mul__(self, other):
+        return self._binary(other, 'mul')
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return self._binary(other, 'truediv')
+    __div__ = __truediv__
+
+    def __rtruediv__(self, other):
+        return self._binary(other, 'rtruediv')
+    __rdiv__ = __rtruediv__
+
+    def __floordiv__(self, other):
+        return self._binary(other, 'floordiv')
+
+    def __rfloordiv__(self, other):
+        return self._binary(other, 'rfloordiv')
+
+    def __pow__(self, other):
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        build = self.unit._power(other)
+        if not float(other).is_integer() and (self.values < 0).any():
+            raise ValueError("Cannot raise negative {0} to the power "
+                             "{1}".format(self.unit.__name__, other))
+        return _wrap(build, self.values ** other)
+
+    def __neg__(self):
+        return type(self).from_si(-self.values)
+
+    def __pos__(self):
+        return type(self).from_si(+self.values)
+
+    def __abs__(self):
+        return type(self).from_si(abs(self.values))
+
+    def __eq__(self, other):
+        return self._compare(other, eq)
+
+    def __ne__(self, other):
+        return self._compare(other, ne)
+
+    def __lt__(self, other):
+        return self._compare(other, lt)
+
+    def __le__(self, other):
+        return self._compare(other, le)
+
+    def __gt__(self, other):
+        return self._compare(other, gt)
+
+    def __ge__(self, other):
+        return self._compare(other, ge)
+
+    __hash__ = None
+
+    def sum(self):
+        """Somme des éléments du tableau."""
+        return self.unit.from_si(float(self.values.sum()))
+
+    def mean(self):
+        """Moyenne des éléments du tableau."""
+        return self.unit.from_si(float(self.values.mean()))
+
+    def min(self):
+        """Plus petit élément du tableau."""
+        return self.unit.from_si(float(self.values.min()))
+
+    def max(self):
+        """Plus grand élément du tableau."""
+        return self.unit.from_si(float(self.values.max()))
+
+    def std(self):
+        """Écart type des éléments du tableau."""
+        return self.unit.from_si(float(self.values.std()))
@@ -32,9 +32,8 @@ class Voltage(Unit):
     fullname = "volt"
     pluralname = "volts"
     convert = {'v': 1, 'statv': STATV_V, 'abv': ABV_V}
-    multiply = {'Current': 'Power', 'Capacity': 'Charge', 'Charge': 'Energy',
-                'Conductance': 'Current'}
-    divide = {'Current': 'Resistance'}
+    dimension = {'M': 1, 'L': 2, 'T': -3, 'I': -1}
+    symbol = 'V'
 
 
 class Current(Unit):
@@ -48,9 +47,10 @@ class Current(Unit):
 
     fullname = "ampere"
     pluralname = "amperes"
-    convert = {'a': 1, 'ma': 1e-3, 'aba': ABA_A, 'bi': ABA_A, 'stata': STATA_A}
-    multiply = {'Voltage': 'Power', 'Time': 'Charge'}
-    divide = {'Voltage': 'Conductance', 'Conductance': 'Voltage'}
+    convert = {'a': 1, 'ma': 1e-3, 'aba': ABA_A, 'bi': ABA_A,
+               'stata': STATA_A}
+    dimension = {'I': 1}
+    symbol = 'A'
 
 
 class Capacity(Unit):
@@ -67,7 +67,8 @@ class Capacity(Unit):
     pluralname = "farads"
     convert = {'f': 1, 'mf': 1e-6, 'abf': ABF_F, 'statf': STATF_F,
                'jar': JAR_F}
-    multiply = {'Voltage': 'Charge', 'Resistance': 'Time'}
+    dimension = {'M': -1, 'L': -2, 'T': 4, 'I': 2}
+    symbol = 'F'
 
 
 class Resistance(Unit):
@@ -83,7 +84,8 @@ class Resistance(Unit):
     pluralname = "ohms"
     convert = {'ohm': 1, 'kohm': 1e3, 'abohm': ABOHM_OHM,
                'statohm': STATOHM_OHM}
-    multiply = {'Capacity': 'Time', 'Current': 'Voltage'}
+    dimension = {'M': 1, 'L': 2, 'T': -3, 'I': -2}
+    symbol = 'ohm'
 
 
 class Charge(Unit):
@@ -100,9 +102,8 @@ class Charge(Unit):
     pluralname = "coulombs"
     convert = {'c': 1, 'abc': ABC_C, 'statc': STATC_C,
                'ah': AH_C, 'mah': AH_C * 1e-3}
-    multiply = {'Voltage': 'Energy'}
-    divide = {'Time': 'Current', 'Current': 'Time',
-              'Voltage': 'Capacity', 'Capacity': 'Voltage'}
+    dimension = {'T': 1, 'I': 1}
+    symbol = 'C'
 
 
 class Conductance(Unit):
@@ -112,7 +113,8 @@ class Conductance(Unit):
 
     fullname = pluralname = "siemens"
     convert = {'s': 1}
-    multiply = {'Voltage': 'Current'}
+    dimension = {'M': -1, 'L': -2, 'T': 3, 'I': 2}
+    symbol = 'S'
 
 
 class MagneticField(Unit):
@@ -126,3 +128,5 @@ class MagneticField(Unit):
     fullname = "tesla"
     pluralname = "teslas"
     convert = {'t': 1, 'gamma': GAMMA_T, 'g': G_T}
+    dimension = {'M': 1, 'T': -2, 'I': -1}
+    symbol = 'T'
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Évaluation différée des calculs sur les unités. Les opérations sur une
+unité enveloppée par `lazy` construisent un arbre d'expression dont le type
+de résultat est déterminé immédiatement ; l'évaluation compile l'arbre en
+une unique expression Python sur les valeurs flottantes, sans créer d'unités
+intermédiaires.
+
+    energy = (lazy(mass) * velocity * velocity / 2).evaluate()
+"""
+
+from math import isinf, isnan
+from numbers import Integral, Real
+from . import Unit, _resolve
+
+try:
+    from .arrays import UnitArray
+except ImportError:  # numpy n'est pas disponible
+    UnitArray = None
+
+# Symboles Python des opérations binaires
+_SYMBOLS = {'add': '+', 'sub': '-', 'mul': '*', 'truediv': '/',
+            'floordiv': '//'}
+
+# Opérations réfléchies, utilisées lorsque seul l'opérande de droite est
+# une unité
+_REFLECTED = {'add': 'add', 'sub': 'rsub', 'mul': 'mul',
+              'truediv': 'rtruediv', 'floordiv': 'rfloordiv'}
+
+# Fonctions déjà compilées, par code source d'expression
+_COMPILED = {}
+
+
+def _pow(value, exponent):
+    """Élever une valeur ou un tableau de valeurs à une puissance, en levant
+    une ValueError plutôt que d'obtenir un complexe ou des valeurs NaN pour
+    un exposant fractionnaire de valeurs négatives."""
+    if hasattr(value, 'dtype') and not float(exponent).is_integer() and \
+            (value < 0).any():
+        result = None
+    else:
+        result = value ** exponent
+    if result is None or isinstance(result, complex):
+        raise ValueError("Cannot raise negative values to the power "
+                         "{0}".format(exponent))
+    return result
+
+
+def _type(build):
+    """Obtenir le type d'unité correspondant à un constructeur de résultat."""
+    return float if build is float else build.__self__
+
+
+def lazy(operand):
+    """Envelopper une unité, un tableau d'unités ou un nombre pour en différer
+    les calculs."""
+    if isinstance(operand, Expression):
+        return operand
+    if isinstance(operand, Unit):
+        return Expression(None, (operand, ), type(operand)._unit, False)
+    if UnitArray is not None and isinstance(operand, UnitArray):
+        return Expression(None, (operand, ), operand.unit, True)
+    if isinstance(operand, (int, float)):
+        return Expression(None, (operand, ), float, False)
+    raise TypeError("Cannot defer computations on {0}".format(
+        type(operand).__name__))
+
+
+class Expression(object):
+    """Nœud d'un arbre d'expression différée. `unit` désigne le type du
+    résultat, `float` pour un nombre sans dimension."""
+    __slots__ = ('operation', 'operands', 'unit', 'array')
+
+    def __init__(self, operation, operands, unit, array):
+        self.operation = operation
+        self.operands = operands
+        self.unit = unit
+        self.array = array
+
+    def __repr__(self):
+        return '<{0} {1} -> {2}>'.format(
+            type(self).__name__, self._source([]), self.unit.__name__)
+
+    def _binary(self, other, name, reflected=False):
+        try:
+            other = lazy(other)
+        except TypeError:
+            return NotImplemented
+        (left, right) = (other, self) if reflected else (self, other)
+        if left.unit is float and right.unit is float:
+            build = float
+        elif left.unit is float:
+            build = _resolve(_REFLECTED[name], right.unit, float)
+        else:
+            build = _resolve(name, left.unit, right.unit)
+        if build is None:
+            raise TypeError("Unsupported operation {0} between {1} and "
+                            "{2}".format(name, left.unit.__name__,
+                                         right.unit.__name__))
+        return Expression(name, (left, right), _type(build),
+                          left.array or right.array)
+
+    def __add__(self, other):
+        return self._binary(other, 'add')
+
+    def __radd__(self, other):
+        return self._binary(other, 'add', True)
+
+    def __sub__(self, other):
+        return self._binary(other, 'sub')
+
+    def __rsub__(self, other):
+        return self._binary(other, 'sub', True)
+
+    def __mul__(self, other):
+        return self._binary(other, 'mul')
+
+    def __rmul__(self, other):
+        return self._binary(other, 'mul', True)
+
+    def __truediv__(self, other):
+        return self._binary(other, 'truediv')
+    __div__ = __truediv__
+
+    def __rtruediv__(self, other):
+        return self._binary(other, 'truediv', True)
+    __rdiv__ = __rtruediv__
+
+    def __floordiv__(self, other):
+        return self._binary(other, 'floordiv')
+
+    def __rfloordiv__(self, other):
+        return self._binary(other, 'floordiv', True)
+
+    def __pow__(self, other):
+        if not isinstance(other, Real):
+            return NotImplemented
+        # L'exposant est inscrit dans le code source de l'expression
+        other = int(other) if isinstance(other, Integral) else float(other)
+        if isinf(other) or isnan(other):
+            raise ValueError("Cannot raise to the power {0}".format(other))
+        unit = float if self.unit is float else _type(self.unit._power(other))
+        return Expression('pow', (self, other), unit, self.array)
+
+    def __neg__(self):
+        return Expression('neg', (self, ), self.unit, self.array)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Expression('abs', (self, ), self.unit, self.array)
+
+    def _source(self, leaves):
+        """Obtenir le code source Python de l'expression, les feuilles étant
+        nommées a0, a1, etc. dans l'ordre où elles sont ajoutées à la liste
+        `leaves`."""
+        if self.operation is None:
+            leaves.append(self.operands[0])
+            return 'a{0}'.format(len(leaves) - 1)
+        elif self.operation == 'neg':
+            return '(-{0})'.format(self.operands[0]._source(leaves))
+        elif self.operation == 'abs':
+            return 'abs({0})'.format(self.operands[0]._source(leaves))
+        elif self.operation == 'pow':
+            return '_pow({0}, {1!r})'.format(
+                self.operands[0]._source(leaves), self.operands[1])
+        return '({0} {1} {2})'.format(
+            self.operands[0]._source(leaves), _SYMBOLS[self.operation],
+            self.operands[1]._source(leaves))
+
+    def evaluate(self):
+        """Évaluer l'expression en une seule passe sur les valeurs des
+        feuilles et obtenir le résultat, unité, tableau d'unités ou nombre."""
+        leaves = []
+        source = self._source(leaves)
+        function = _COMPILED.get(source)
+        if function is None:
+            function = _COMPILED[source] = eval('lambda {0}: {1}'.format(
+                ', '.join('a{0}'.format(i) for i in range(len(leaves))),
+                source))
+        result = function(*[
+            leaf.value if isinstance(leaf, Unit) else
+            getattr(leaf, 'values', leaf) for leaf in leaves])
+        if self.unit is float:
+            return result
+        if self.array:
+            return UnitArray.of(self.unit).from_si(result)
+        return self.unit.from_si(result)
@@ -57,8 +57,8 @@ class Distance(Unit):
     pluralname = "meters"
     convert = {'nm': 1e-9, 'm': 1, 'km': 1e3, 'au': AU_M, 'ly': LY_M,
                'inch': IN_M, 'ft': FT_M, 'yd': YD_M, 'mi': MI_M}
-    multiply = {'Distance': 'Area', 'Area': 'Volume', 'Force': 'Energy'}
-    divide = {'Time': 'Velocity', 'Velocity': 'Time'}
+    dimension = {'L': 1}
+    symbol = 'm'
 
 
 class Time(Unit):
@@ -73,11 +73,8 @@ class Time(Unit):
     fullname = "second"
     pluralname = "seconds"
     convert = {'s': 1, 'm': MIN_S, 'min': MIN_S, 'h': H_S, 'd': D_S}
-    multiply = {'Velocity': 'Distance', 'Acceleration': 'Velocity',
-                'Current': 'Charge', 'AngularVelocity': 'Angle',
-                'Force': 'Momentum'}
-    divide = {'Resistance': 'Capacity', 'Capacity': 'Resistance'}
-    inverse = 'Frequency'
+    dimension = {'T': 1}
+    symbol = 's'
 
 
 class Velocity(Unit):
@@ -91,9 +88,7 @@ class Velocity(Unit):
     fullname = "meter per second"
     pluralname = "meters per second"
     convert = {'mps': 1, 'kph': KPH_MPS, 'mph': MPH_MPS}
-    multiply = {'Time': 'Distance', 'Mass': 'Momentum'}
-    divide = {'Time': 'Acceleration', 'Acceleration': 'Time',
-              'Frequency': 'Distance'}
+    dimension = {'L': 1, 'T': -1}
 
 
 class Acceleration(Unit):
@@ -104,8 +99,7 @@ class Acceleration(Unit):
     fullname = "meter per second squared"
     pluralname = "meters per second squared"
     convert = {'mpss': 1, 'kphs': KPH_MPS, 'g': G_MPSS}
-    multiply = {'Time': 'Velocity', 'Mass': 'Force'}
-    divide = {'Frequency': 'Velocity'}
+    dimension = {'L': 1, 'T': -2}
 
 
 class Mass(Unit):
@@ -126,7 +120,8 @@ class Mass(Unit):
     pluralname = "kilograms"
     convert = {'t': 1e3, 'kg': 1, 'g': 1e-3, 'mg': 1e-6, 'ug': 1e-9,
                'lb': LB_KG, 'oz': OZ_KG, 'dr': DR_KG, 'gr': GR_KG}
-    multiply = {'Acceleration': 'Force', 'Velocity': 'Momentum'}
+    dimension = {'M': 1}
+    symbol = 'g'
 
 
 class Force(Unit):
@@ -142,10 +137,8 @@ class Force(Unit):
     fullname = "newton"
     pluralname = "newtons"
     convert = {'n': 1, 'dyn': DYN_N, 'kgf': KGF_N, 'lbf': LBF_N, 'pdl': PDL_N}
-    multiply = {'Distance': 'Energy', 'Time': 'Momentum'}
-    divide = {'Acceleration': 'Mass', 'Distance': 'SurfaceTension',
-              'Mass': 'Acceleration', 'Pressure': 'Area', 'Area': 'Pressure',
-              'Frequency': 'Momentum', 'Momentum': 'Frequency'}
+    dimension = {'M': 1, 'L': 1, 'T': -2}
+    symbol = 'N'
 
 
 class Area(Unit):
@@ -162,9 +155,7 @@ class Area(Unit):
     pluralname = "square meters"
     convert = {'m2': 1, 'km2': 1e-6, 'acre': ACRE_M2, 'arpent': ARPENT_M2,
                'ha': HA_M2}
-    multiply = {'Distance': 'Volume', 'Pressure': 'Force',
-                'Illuminance': 'LightFlow'}
-    divide = {'Distance': 'Distance'}
+    dimension = {'L': 2}
 
 
 class Volume(Unit):
@@ -178,7 +169,8 @@ class Volume(Unit):
     fullname = "cubic meter"
     pluralname = "cubic meters"
     convert = {'m3': 1, 'km3': 1e-9, 'l': L_M3}
-    divide = {'Distance': 'Area', 'Area': 'Distance'}
+    dimension = {'L': 3}
+    symbol = 'L'
 
 
 class Energy(Unit):
@@ -196,8 +188,8 @@ class Energy(Unit):
     pluralname = "joules"
     convert = {'j': 1, 'kwh': KWH_J, 'kgm': KGM_J, 'cal': CAL_J,
                'kcal': CAL_J * 1e3, 'ev': EV_J}
-    divide = {'Distance': 'Force', 'Force': 'Distance',
-              'Voltage': 'Charge', 'Charge': 'Voltage'}
+    dimension = {'M': 1, 'L': 2, 'T': -2}
+    symbol = 'J'
 
 
 class ChemicalAmount(Unit):
@@ -208,6 +200,8 @@ class ChemicalAmount(Unit):
     fullname = "mole"
     pluralname = "moles"
     convert = {'mol': 1}
+    dimension = {'N': 1}
+    symbol = 'mol'
 
 
 class Frequency(Unit):
@@ -217,9 +211,8 @@ class Frequency(Unit):
 
     fullname = pluralname = "hertz"
     convert = {'hz': 1}
-    multiply = {'Distance': 'Velocity', 'Velocity': 'Acceleration',
-                'Energy': 'Power', 'Momentum': 'Force'}
-    inverse = 'Time'
+    dimension = {'T': -1}
+    symbol = 'Hz'
 
 
 class Power(Unit):
@@ -233,9 +226,8 @@ class Power(Unit):
     fullname = "watt"
     pluralname = "watts"
     convert = {'w': 1, 'ch': CH_W, 'hp': HP_W}
-    multiply = {'Time': 'Energy'}
-    divide = {'Frequency': 'Energy',
-              'Voltage': 'Current', 'Current': 'Voltage'}
+    dimension = {'M': 1, 'L': 2, 'T': -3}
+    symbol = 'W'
 
 
 class Flow(Unit):
@@ -254,9 +246,7 @@ class Flow(Unit):
     convert = {'m3s': 1, 'm3m': MIN_S, 'm3min': MIN_S, 'm3h': H_S,
                'ls': L_M3, 'lm': MIN_S * L_M3, 'lmin': MIN_S * L_M3,
                'lh': H_S * L_M3}
-    multiply = {'Time': 'Volume'}
-    divide = {'Frequency': 'Volume', 'Volume': 'Frequency',
-              'Area': 'Velocity', 'Velocity': 'Area'}
+    dimension = {'L': 3, 'T': -1}
 
 
 class Momentum(Unit):
@@ -267,9 +257,7 @@ class Momentum(Unit):
     fullname = "kilogram meter per second"
     pluralname = "kilogram meters per second"
     convert = {'kgmps': 1}
-    multiply = {'Frequency': 'Force'}
-    divide = {'Mass': 'Velocity', 'Velocity': 'Mass', 'Force': 'Time',
-              'Time': 'Force'}
+    dimension = {'M': 1, 'L': 1, 'T': -1}
 
 
 class SurfaceTension(Unit):
@@ -282,8 +270,7 @@ class SurfaceTension(Unit):
     fullname = "newton per meter"
     pluralname = "newtons per meter"
     convert = {'nm': 1, 'lbfin': LBF_N / IN_M}
-    multiply = {'Distance': 'Force'}
-    divide = {}
+    dimension = {'M': 1, 'T': -2}
 
 
 class VolumicMass(Unit):
@@ -296,5 +283,4 @@ class VolumicMass(Unit):
     fullname = "kilogram per cubic meter"
     pluralname = "kilograms per cubic meter"
     convert = {'kgm3': 1, 'gcm3': 0.001}
-    multiply = {'Volume': 'Mass'}
-    divide = {}
+    dimension = {'M': 1, 'L': -3}
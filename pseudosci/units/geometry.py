@@ -24,8 +24,8 @@ class Angle(Unit):
     fullname = "radian"
     pluralname = "radians"
     convert = {'rad': 1, 'deg': DEG_RAD, 'gon': GON_RAD}
-    multiply = {'Frequency': 'AngularVelocity'}
-    divide = {'Time': 'AngularVelocity'}
+    dimension = {'A': 1}
+    symbol = 'rad'
 
 
 class AngularVelocity(Unit):
@@ -42,5 +42,4 @@ class AngularVelocity(Unit):
     pluralname = "radians per second"
     convert = {'rads': 1, 'radmin': MIN_S, 'radm': MIN_S, 'radh': H_S,
                'degs': DEG_RAD, 'rpm': MIN_S / (2 * pi)}
-    multiply = {'Time': 'Angle'}
-    divide = {'Frequency': 'Angle', 'Angle': 'Frequency'}
+    dimension = {'A': 1, 'T': -1}
@@ -2,7 +2,7 @@
 # -*- coding:utf-8 -*-
 """Unités de mesures relatives à l'énergie thermique."""
 
-from . import Unit
+from . import Unit, Affine
 from .general import Area, Force
 
 # Constantes de conversion - modifiez-les pour briser la thermodynamique
@@ -11,6 +11,12 @@ HPA_PA = 100
 BAR_PA = 1e5
 ATM_PA = 101325
 
+# Échelles de température, sous forme de conversions affines vers le Kelvin
+KELVIN = Affine(1)
+CELSIUS = Affine(1, C_K)
+FAHRENHEIT = Affine(5.0 / 9.0, C_K, 32.0)
+BENAMRAN = Affine((356.7 - 4.2) / 187, 4.2 + C_K)
+
 
 class Temperature(Unit):
     """Décrit une mesure de température. L'unité correspondante du système
@@ -23,37 +29,34 @@ class Temperature(Unit):
 
     fullname = "Kelvin degree"
     pluralname = "Kelvin degrees"
-    convert = {'k': 1,
-               'c': (lambda c: c + C_K, lambda k: k - C_K),
-               'f': (lambda f: (5.0 / 9.0) * (f - 32.0) + C_K,
-                     lambda k: (9.0 / 5.0) * (k - C_K) + 32.0),
-               'b': (lambda b: b * (356.7 - 4.2) / 187 + 4.2 + C_K,
-                     lambda k: (k - C_K - 4.2) * 187 / (356.7 - 4.2))}
+    convert = {'k': KELVIN, 'c': CELSIUS, 'f': FAHRENHEIT, 'b': BENAMRAN}
+    dimension = {'K': 1}
+    symbol = 'K'
 
     @staticmethod
     def fahrenheit2kelvin(f):
         """Convertir de degrés Fahrenheit en degrés Kelvin."""
-        return Temperature.fahrenheit2celsius(f) + C_K
+        return FAHRENHEIT(f)
 
     @staticmethod
     def fahrenheit2celsius(f):
         """Convertir de degrés Fahrenheit en degrés Celsius."""
-        return (5.0 / 9.0) * (f - 32.0)
+        return FAHRENHEIT.then(CELSIUS)(f)
 
     @staticmethod
     def kelvin2fahrenheit(k):
         """Convertir de degrés Kelvin en degrés Fahrenheit."""
-        return (9.0 / 5.0) * Temperature.kelvin2celsius(k) + 32.0
+        return FAHRENHEIT.inverse(k)
 
     @staticmethod
     def kelvin2celsius(k):
         """Convertir de degrés Kelvin en degrés Celsius."""
-        return k - C_K
+        return CELSIUS.inverse(k)
 
     @staticmethod
     def celsius2kelvin(c):
         """Convertir de degrés Celsius en degrés Kelvin."""
-        return c + C_K
+        return CELSIUS(c)
 
 
 class Pressure(Unit):
@@ -68,4 +71,5 @@ class Pressure(Unit):
     fullname = "pascal"
     pluralname = "pascals"
     convert = {'pa': 1, 'hpa': HPA_PA, 'bar': BAR_PA, 'atm': ATM_PA}
-    multiply = {'Area': 'Force'}
+    dimension = {'M': 1, 'L': -1, 'T': -2}
+    symbol = 'Pa'
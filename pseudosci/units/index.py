@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Index trié de mesures d'un même type, permettant des requêtes par
+intervalle en temps logarithmique :
+
+    index = UnitIndex(movements, key=lambda m: m.time)
+    index.range(Time(h=2), Time(h=3))
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+def _identity(element):
+    return element
+
+
+class UnitIndex(object):
+    """Collection triée d'éléments indexés par une unité, l'élément lui-même
+    par défaut ou l'unité renvoyée par la fonction `key`. Les clés sont
+    conservées sous forme de valeurs du système international."""
+
+    def __init__(self, elements=(), key=None, unit=None):
+        self.key = key or _identity
+        self.unit = unit
+        pairs = sorted(((self._value(e), e) for e in elements),
+                       key=lambda pair: pair[0])
+        self._keys = [pair[0] for pair in pairs]
+        self._elements = [pair[1] for pair in pairs]
+
+    def _value(self, element):
+        """Obtenir la valeur de la clé d'un élément, en vérifiant son
+        type."""
+        key = self.key(element)
+        unit = getattr(type(key), '_unit', type(key))
+        if self.unit is None:
+            self.unit = unit
+        elif unit is not self.unit:
+            raise TypeError("Cannot index {0} in an index of {1}".format(
+                type(key).__name__, self.unit.__name__))
+        return key.value
+
+    def _bound(self, bound):
+        """Obtenir la valeur d'une borne de requête."""
+        if getattr(type(bound), '_unit', None) is not self.unit:
+            raise TypeError("Invalid bound {0} for an index of {1}".format(
+                type(bound).__name__, getattr(self.unit, '__name__', None)))
+        return bound.value
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __iter__(self):
+        return iter(self._elements)
+
+    def __repr__(self):
+        return '<{0} of {1} {2}>'.format(
+            type(self).__name__, len(self),
+            getattr(self.unit, '__name__', None))
+
+    def add(self, element):
+        """Insérer un élément à sa place."""
+        value = self._value(element)
+        i = bisect_right(self._keys, value)
+        self._keys.insert(i, value)
+        self._elements.insert(i, element)
+
+    def remove(self, element):
+        """Retirer un élément ; une ValueError est levée s'il est absent."""
+        value = self._value(element)
+        i = bisect_left(self._keys, value)
+        j = bisect_right(self._keys, value)
+        for k in range(i, j):
+            if self._elements[k] is element or self._elements[k] == element:
+                del self._keys[k]
+                del self._elements[k]
+                return
+        raise ValueError("Element not in index")
+
+    def _slice(self, low, high):
+        if not self._keys:
+            return (0, 0)
+        i = 0 if low is None else bisect_left(self._keys, self._bound(low))
+        j = len(self._keys) if high is None else \
+            bisect_right(self._keys, self._bound(high))
+        return (i, max(i, j))
+
+    def range(self, low=None, high=None):
+        """Obtenir la liste triée des éléments dont la clé est comprise entre
+        `low` et `high` inclus. Une borne None n'est pas limitée."""
+        (i, j) = self._slice(low, high)
+        return self._elements[i:j]
+
+    def count(self, low=None, high=None):
+        """Compter les éléments dont la clé est comprise entre `low` et
+        `high` inclus."""
+        (i, j) = self._slice(low, high)
+        return j - i
+
+    def min(self):
+        """Élément de plus petite clé."""
+        return self._elements[0]
+
+    def max(self):
+        """Élément de plus grande clé."""
+        return self._elements[-1]
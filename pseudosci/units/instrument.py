@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Instrumentation des unités. Le temps d'un bloc `with`, les méthodes des
+unités sont remplacées par des versions comptant leurs appels par classe et
+par opération, y compris les lectures et écritures des attributs de
+conversion, ainsi que les recherches d'attributs échouées et les
+opérations renvoyant NotImplemented ; les méthodes d'origine sont rétablies
+à la sortie du bloc, si bien que l'instrumentation ne coûte rien lorsqu'elle
+est désactivée.
+
+    with UnitBase.instrumented() as stats:
+        ...
+    print(stats.report())
+"""
+
+from collections import Counter
+from . import UnitBase, Unit, ConversionAttribute, _OPERATIONS
+
+# Méthodes instrumentées
+METHODS = ('__init__', 'convertfrom', 'convertto', '__getattr__',
+           '__setattr__', '__add__', '__radd__', '__sub__', '__rsub__',
+           '__mul__', '__rmul__', '__div__', '__rdiv__', '__truediv__',
+           '__rtruediv__', '__floordiv__', '__rfloordiv__', '__pow__',
+           '__neg__', '__pos__', '__abs__', '__eq__', '__ne__', '__lt__',
+           '__le__', '__gt__', '__ge__')
+
+# Instrumentations actives et méthodes d'origine des classes instrumentées
+_ACTIVE = []
+_ORIGINALS = {}
+
+
+def _count(key):
+    for stats in _ACTIVE:
+        stats.counts[key] += 1
+
+
+def _method(name, function):
+    """Envelopper une méthode d'unité pour compter ses appels."""
+    def method(self, *args, **kwargs):
+        unit = type(self).__name__
+        _count((unit, name))
+        try:
+            result = function(self, *args, **kwargs)
+        except AttributeError:
+            _count((unit, name + ' failed'))
+            raise
+        if result is NotImplemented:
+            _count((unit, name + ' NotImplemented'))
+        return result
+    method.__name__ = name
+    return method
+
+
+def _from_si(function):
+    """Envelopper le constructeur `from_si` pour compter les instances
+    créées."""
+    def from_si(cls, value):
+        _count((cls.__name__, 'from_si'))
+        return function(cls, value)
+    return classmethod(from_si)
+
+
+def _attribute_get(function):
+    def __get__(self, instance, owner):
+        if instance is not None:
+            _count((owner.__name__, 'get ' + self.name))
+        return function(self, instance, owner)
+    return __get__
+
+
+def _attribute_set(function):
+    def __set__(self, instance, value):
+        _count((type(instance).__name__, 'set ' + self.name))
+        return function(self, instance, value)
+    return __set__
+
+
+def _patch(cls):
+    """Instrumenter les méthodes d'une classe d'unité."""
+    attrs = vars(cls)
+    for name in METHODS:
+        if name in attrs and (cls, name) not in _ORIGINALS:
+            _ORIGINALS[(cls, name)] = attrs[name]
+            type.__setattr__(cls, name, _method(name, attrs[name]))
+    if 'from_si' in attrs and (cls, 'from_si') not in _ORIGINALS:
+        _ORIGINALS[(cls, 'from_si')] = attrs['from_si']
+        type.__setattr__(cls, 'from_si',
+                         _from_si(attrs['from_si'].__func__))
+
+
+def _reset():
+    """Oublier les opérations mémorisées, qui référencent les
+    constructeurs des unités."""
+    _OPERATIONS.clear()
+    UnitBase.revision += 1
+
+
+def _enable():
+    for cls in [Unit] + list(UnitBase.units.values()):
+        _patch(cls)
+    for (name, wrapper) in (('__get__', _attribute_get),
+                            ('__set__', _attribute_set)):
+        function = vars(ConversionAttribute)[name]
+        _ORIGINALS[(ConversionAttribute, name)] = function
+        setattr(ConversionAttribute, name, wrapper(function))
+    UnitBase.hooks.append(_patch)
+    _reset()
+
+
+def _disable():
+    UnitBase.hooks.remove(_patch)
+    for ((cls, name), attr) in _ORIGINALS.items():
+        type.__setattr__(cls, name, attr)
+    _ORIGINALS.clear()
+    _reset()
+
+
+class Instrumentation(object):
+    """Compteurs d'appels des méthodes des unités, associant à un couple
+    (nom de classe, opération) le nombre d'appels. Actifs dans un bloc
+    `with` ; plusieurs instrumentations peuvent être imbriquées."""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def __enter__(self):
+        if not _ACTIVE:
+            _enable()
+        _ACTIVE.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        _ACTIVE.remove(self)
+        if not _ACTIVE:
+            _disable()
+        return False
+
+    def __getitem__(self, key):
+        return self.counts[key]
+
+    def total(self, operation):
+        """Nombre total d'appels d'une opération, toutes classes
+        confondues."""
+        return sum(count for ((unit, name), count) in self.counts.items()
+                   if name == operation)
+
+    def report(self):
+        """Obtenir un tableau récapitulatif des compteurs, par nombre
+        d'appels décroissant."""
+        rows = sorted(((unit, name, count) for ((unit, name), count)
+                       in self.counts.items()),
+                      key=lambda row: (-row[2], row[0], row[1]))
+        rows.insert(0, ('Unit', 'Operation', 'Count'))
+        widths = [max(len(str(row[i])) for row in rows) for i in range(3)]
+        return '\n'.join('{0:<{3}}  {1:<{4}}  {2:>{5}}'.format(
+            *(row + tuple(widths))) for row in rows)
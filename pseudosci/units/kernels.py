@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Noyaux de calcul sur valeurs brutes. Le décorateur `boundary` vérifie les
+unités des arguments et les convertit en flottants du système international
+une seule fois par appel ; le corps de la fonction travaille sur des nombres
+ou des tableaux NumPy, et son résultat est de nouveau converti en unité.
+
+    @boundary(distance=Distance, time=Time, returns=Velocity)
+    def speed(distance, time):
+        return distance / time
+"""
+
+from functools import wraps
+from numbers import Real
+from . import Unit
+
+
+def _strip(name, unit, arg):
+    """Obtenir la valeur brute d'un argument, après vérification de son
+    unité. None est transmis tel quel."""
+    if isinstance(arg, unit):
+        return arg.value
+    if arg is None:
+        return None
+    if not isinstance(arg, Unit) and getattr(arg, 'unit', None) is unit:
+        return arg.values
+    raise TypeError("Argument {0} must be {1}, not {2}".format(
+        name, unit.__name__, type(arg).__name__))
+
+
+def _wrap(unit, result):
+    """Convertir un résultat brut, nombre ou tableau, en unité `unit`. Les
+    scalaires NumPy, y compris les tableaux à zéro dimension, sont convertis
+    en unités et non en tableaux."""
+    if unit is None or result is None:
+        return result
+    if isinstance(result, Real) or getattr(result, 'ndim', None) == 0:
+        return unit.from_si(float(result))
+    from .arrays import UnitArray
+    return UnitArray.of(unit).from_si(result)
+
+
+def boundary(returns=None, **units):
+    """Décorer une fonction de calcul dont les arguments nommés dans `units`
+    sont des unités du type indiqué. La fonction reçoit leurs valeurs dans
+    le système international. `returns` est l'unité du résultat, un tuple
+    d'unités si la fonction renvoie un tuple, ou None pour ne pas convertir
+    le résultat."""
+    def decorator(function):
+        code = function.__code__
+        names = code.co_varnames[:code.co_argcount]
+        positions = tuple((i, name, units[name])
+                          for (i, name) in enumerate(names) if name in units)
+        unknown = set(units) - set(names)
+        if unknown:
+            raise TypeError("{0}() has no argument {1}".format(
+                function.__name__, ', '.join(sorted(unknown))))
+
+        @wraps(function)
+        def kernel(*args, **kwargs):
+            args = list(args)
+            for (i, name, unit) in positions:
+                if i < len(args):
+                    args[i] = _strip(name, unit, args[i])
+                elif name in kwargs:
+                    kwargs[name] = _strip(name, unit, kwargs[name])
+            result = function(*args, **kwargs)
+            if isinstance(returns, tuple):
+                if len(result) != len(returns):
+                    raise ValueError("{0}() returned {1} values, expected "
+                                     "{2}".format(function.__name__,
+                                                  len(result), len(returns)))
+                return tuple(_wrap(unit, value)
+                             for (unit, value) in zip(returns, result))
+            return _wrap(returns, result)
+        return kernel
+    return decorator
@@ -18,6 +18,8 @@ class LightIntensity(Unit):
     fullname = "candela"
     pluralname = "candelas"
     convert = {'cd': 1}
+    dimension = {'J': 1}
+    symbol = 'cd'
 
 
 class LightFlow(Unit):
@@ -28,7 +30,8 @@ class LightFlow(Unit):
     fullname = "lumen"
     pluralname = "lumens"
     convert = {'lm': 1}
-    divide = {'Illuminance': 'Area', 'Area': 'Illuminance'}
+    dimension = {'J': 1, 'A': 2}
+    symbol = 'lm'
 
 
 class Illuminance(Unit):
@@ -41,4 +44,5 @@ class Illuminance(Unit):
 
     fullname = pluralname = "lux"
     convert = {'lx': 1, 'lux': 1, 'phot': PHOT_LX, 'nox': NOX_LX}
-    multiply = {'Area': 'LightFlow'}
+    dimension = {'J': 1, 'A': 2, 'L': -2}
+    symbol = 'lx'
@@ -1,16 +1,34 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
-"""Unités de mesure monétaires. Le package Python `forex-python` est requis.
-Une connexion Internet est nécessaire ; les taux de conversion sont chargés à
-l'importation du module."""
+"""Unités de mesure monétaires. Les taux de change sont chargés à
+l'importation du module depuis un instantané local, partagé entre les
+processus et renouvelé auprès d'un fournisseur de taux lorsqu'il est plus
+ancien que `RATES_TTL` secondes. Le fournisseur par défaut utilise le package
+Python `forex-python` et nécessite une connexion Internet ; il peut être
+remplacé par `set_provider`, par exemple par `file_provider(chemin)`."""
 
+import json
+import os
+import tempfile
+import time
+import warnings
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from threading import Event, Lock, Thread
 from . import Unit
-from forex_python.converter import CurrencyRates
-from forex_python.bitcoin import BtcConverter
 
+# Durée de validité de l'instantané des taux de change, en secondes
+RATES_TTL = 24 * 3600
+# Emplacement de l'instantané des taux de change
+SNAPSHOT_PATH = os.environ.get('PSEUDOSCI_RATES', os.path.join(
+    os.path.expanduser('~'), '.cache', 'pseudosci', 'rates.json'))
 
-def get_rates():
-    """Obtenir les derniers taux de change à partir des dollars USD."""
+
+def forex_provider():
+    """Obtenir les derniers taux de change à partir des dollars USD auprès
+    des services de forex-python."""
+    from forex_python.converter import CurrencyRates
+    from forex_python.bitcoin import BtcConverter
     rates = CurrencyRates().get_rates('USD')
     rates.update({
         'BTC': BtcConverter().get_latest_price('USD'),
@@ -19,6 +37,156 @@ def get_rates():
     return rates
 
 
+def file_provider(path):
+    """Obtenir un fournisseur lisant les taux de change dans un fichier JSON
+    associant un code de monnaie à son taux à partir des dollars USD."""
+    def provider():
+        with open(path) as f:
+            return json.load(f)
+    return provider
+
+
+_PROVIDER = [forex_provider]
+
+
+def set_provider(provider):
+    """Remplacer le fournisseur de taux de change, une fonction sans
+    paramètre renvoyant un dictionnaire de taux à partir des dollars USD."""
+    _PROVIDER[0] = provider
+
+
+def get_rates():
+    """Obtenir les derniers taux de change à partir des dollars USD auprès du
+    fournisseur de taux."""
+    return _PROVIDER[0]()
+
+
+def _read_snapshot(path):
+    """Lire un instantané, ou renvoyer None s'il est absent ou invalide."""
+    try:
+        with open(path) as f:
+            snapshot = json.load(f)
+        return (float(snapshot['timestamp']), dict(snapshot['rates']))
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_snapshot(path, rates):
+    """Écrire un instantané de manière atomique, afin que les autres
+    processus ne lisent jamais un fichier incomplet."""
+    directory = os.path.dirname(path) or '.'
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    (fd, tmp) = tempfile.mkstemp(dir=directory)
+    with os.fdopen(fd, 'w') as f:
+        json.dump({'timestamp': time.time(), 'rates': rates}, f)
+    getattr(os, 'replace', os.rename)(tmp, path)
+
+
+def load_rates(ttl=None, path=None, default={'USD': 1}):
+    """Obtenir les taux de change depuis l'instantané local s'il date de
+    moins de `ttl` secondes (`RATES_TTL` par défaut), ou auprès du
+    fournisseur sinon, en mettant à jour l'instantané. Si le fournisseur
+    échoue, l'instantané est utilisé quel que soit son âge ; à défaut, les
+    taux `default` sont renvoyés, seul le dollar USD par défaut."""
+    ttl = RATES_TTL if ttl is None else ttl
+    path = SNAPSHOT_PATH if path is None else path
+    snapshot = _read_snapshot(path)
+    if snapshot is not None and time.time() - snapshot[0] < ttl:
+        return snapshot[1]
+    try:
+        rates = get_rates()
+    except Exception as e:
+        if snapshot is not None:
+            return snapshot[1]
+        if default is not None:
+            warnings.warn("Exchange rates unavailable: {0}".format(e))
+            return dict(default)
+        return None
+    try:
+        _write_snapshot(path, rates)
+    except (IOError, OSError) as e:
+        warnings.warn("Cannot save exchange rates: {0}".format(e))
+    return rates
+
+
+_PUBLISH_LOCK = Lock()
+
+
+def publish_rates(rates, unit=None):
+    """Remplacer les taux de change de Currency, ou de `unit`, par une copie
+    de `rates`. Les tables de taux publiées ne sont plus jamais modifiées :
+    l'index de conversion de l'unité est reconstruit puis remplacé d'un
+    bloc, si bien que les conversions en cours voient toujours l'ancienne
+    ou la nouvelle table, jamais un mélange des deux."""
+    table = dict(rates)
+    with _PUBLISH_LOCK:
+        (unit or Currency).convert = table
+
+
+class RateRefresher(object):
+    """Renouvelle les taux de change toutes les `interval` secondes, dans un
+    thread d'arrière-plan (`start`) ou dans une boucle asyncio
+    (`schedule`). Les taux sont obtenus par `load_rates`, donc depuis
+    l'instantané partagé s'il a été renouvelé entre-temps par un autre
+    processus ; ils sont conservés si aucun taux n'est disponible."""
+
+    def __init__(self, interval=RATES_TTL, unit=None, path=None):
+        self.interval = interval
+        self.unit = unit
+        self.path = path
+        self._stopped = Event()
+        self._thread = None
+        self._handle = None
+
+    def refresh(self):
+        """Renouveler immédiatement les taux. Renvoie True si de nouveaux
+        taux ont été publiés."""
+        rates = load_rates(ttl=self.interval, path=self.path, default=None)
+        if rates is None:
+            return False
+        publish_rates(rates, self.unit)
+        return True
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.refresh()
+
+    def start(self):
+        """Renouveler les taux dans un thread d'arrière-plan."""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = Thread(target=self._run, name='RateRefresher')
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def schedule(self, loop):
+        """Renouveler les taux depuis une boucle asyncio ; les taux sont
+        obtenus dans l'exécuteur de la boucle, sans la bloquer."""
+        def fetched(future):
+            if future.exception() is None and future.result() is not None:
+                publish_rates(future.result(), self.unit)
+
+        def tick():
+            future = loop.run_in_executor(
+                None, load_rates, self.interval, self.path, None)
+            future.add_done_callback(fetched)
+            self._handle = loop.call_later(self.interval, tick)
+        self._handle = loop.call_later(self.interval, tick)
+        return self
+
+    def stop(self):
+        """Arrêter le renouvellement des taux."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+
 class Currency(Unit):
     """Décrit une quantité de monnaie. L'unité de référence utilisée est le
     dollar américain (USD).\n
@@ -28,8 +196,132 @@ class Currency(Unit):
 
     fullname = "dollar américain"
     pluralname = "dollars américains"
-    convert = get_rates()
+    convert = load_rates()
 
     def update_rates(self):
-        """Forcer la mise à jour des taux de change."""
-        convert = get_rates()
+        """Forcer la mise à jour des taux de change. Si ni le fournisseur ni
+        l'instantané ne sont disponibles, les taux actuels sont conservés ;
+        renvoie True si de nouveaux taux ont été publiés."""
+        rates = load_rates(ttl=0, default=None)
+        if rates is None:
+            return False
+        publish_rates(rates, type(self)._unit)
+        return True
+
+
+_EPOCH = date(1970, 1, 1)
+
+
+def _day(when):
+    """Obtenir le nombre de jours écoulés depuis le 1er janvier 1970 pour une
+    date, sous forme d'objet `date` ou de chaîne `AAAA-MM-JJ`."""
+    if isinstance(when, datetime):
+        when = when.date()
+    elif not isinstance(when, date):
+        when = datetime.strptime(str(when)[:10], '%Y-%m-%d').date()
+    return (when - _EPOCH).days
+
+
+class RateHistory(object):
+    """Historique de taux de change à partir des dollars USD, indexé par code
+    de monnaie et trié par date. Le taux applicable à une date est le
+    dernier taux connu à cette date. Les montants sont convertis comme par
+    Currency."""
+
+    def __init__(self):
+        # Jours et taux connus, triés par jour, pour chaque code de monnaie
+        self._days = {}
+        self._rates = {}
+        # Tableaux NumPy correspondants, construits à la demande
+        self._arrays = {}
+
+    def __len__(self):
+        return sum(len(days) for days in self._days.values())
+
+    def __contains__(self, code):
+        return code.upper() in self._days
+
+    def currencies(self):
+        """Obtenir la liste triée des codes de monnaie connus."""
+        return sorted(self._days)
+
+    def add(self, when, rates):
+        """Enregistrer les taux de change d'une date, en remplaçant les taux
+        déjà connus pour cette date."""
+        day = _day(when)
+        for (code, rate) in rates.items():
+            code = code.upper()
+            (days, values) = (self._days.setdefault(code, []),
+                              self._rates.setdefault(code, []))
+            i = bisect_left(days, day)
+            if i < len(days) and days[i] == day:
+                values[i] = float(rate)
+            else:
+                days.insert(i, day)
+                values.insert(i, float(rate))
+            self._arrays.pop(code, None)
+
+    def load(self, path):
+        """Charger des taux depuis un fichier JSON associant une date
+        `AAAA-MM-JJ` à un dictionnaire de taux, ou depuis un dossier de
+        fichiers JSON de taux nommés d'après leur date, tels que les
+        instantanés de `load_rates`."""
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith('.json'):
+                    with open(os.path.join(path, name)) as f:
+                        rates = json.load(f)
+                    self.add(name[:-5], rates.get('rates', rates))
+        else:
+            with open(path) as f:
+                for (when, rates) in json.load(f).items():
+                    self.add(when, rates)
+        return self
+
+    def rate(self, code, when):
+        """Obtenir le taux d'une monnaie applicable à une date. Une
+        KeyError est levée si aucun taux n'est connu à cette date."""
+        code = code.upper()
+        days = self._days.get(code, ())
+        i = bisect_right(days, _day(when)) - 1
+        if i < 0:
+            raise KeyError("No {0} rate on {1}".format(code, when))
+        return self._rates[code][i]
+
+    def currency(self, amount, code, when):
+        """Convertir un montant d'une monnaie à une date en Currency."""
+        return Currency.from_si(amount * self.rate(code, when))
+
+    def _array(self, code):
+        arrays = self._arrays.get(code)
+        if arrays is None:
+            import numpy
+            arrays = self._arrays[code] = (
+                numpy.array(self._days[code], dtype=numpy.int64),
+                numpy.array(self._rates[code], dtype=numpy.float64))
+        return arrays
+
+    def convert(self, amounts, codes, dates):
+        """Convertir des séquences de montants, de codes de monnaie et de
+        dates en un tableau de Currency, par une recherche vectorisée pour
+        chaque monnaie. Les dates peuvent être des objets `date`, des
+        chaînes `AAAA-MM-JJ` ou un tableau NumPy `datetime64`. Le package
+        Python `numpy` est requis."""
+        import numpy
+        from .arrays import UnitArray
+        amounts = numpy.asarray(amounts, dtype=numpy.float64)
+        codes = numpy.char.upper(numpy.asarray(codes, dtype=str))
+        days = numpy.asarray(dates, dtype='datetime64[D]').astype(
+            numpy.int64)
+        rates = numpy.empty(len(amounts))
+        (unique, inverse) = numpy.unique(codes, return_inverse=True)
+        for (i, code) in enumerate(unique):
+            rows = inverse == i
+            if code not in self._days:
+                raise KeyError("No {0} rate".format(code))
+            (known, values) = self._array(str(code))
+            index = numpy.searchsorted(known, days[rows], side='right') - 1
+            if (index < 0).any():
+                raise KeyError("No {0} rate on some dates".format(code))
+            rates[rows] = values[index]
+        return UnitArray.of(Currency).from_si(amounts * rates)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Analyse de mesures textuelles, telles que "80 km/h", "1.4 m/s^2" ou
+"30.5 t". Chaque expression d'unité distincte n'est analysée qu'une seule
+fois ; les analyses suivantes se limitent à la lecture du nombre."""
+
+import re
+from importlib import import_module
+from . import UnitBase, _combine
+
+_MEASURE = re.compile(
+    r'^\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(.*?)\s*$')
+_TERM = re.compile(r'^([^\s^]+?)(?:\^\(?(-?\d+)\)?)?$')
+_SEPARATORS = re.compile(r'\s*([*/.·])\s*')
+
+# Expressions d'unités déjà analysées, associant à un couple (expression,
+# unité attendue) le constructeur du résultat et la conversion vers l'unité
+# du système international
+_COMPILED = {}
+_REVISION = [None]
+
+# Modules d'unités importés avant l'analyse des mesures. Lorsqu'un nom de
+# conversion appartient à plusieurs unités, les unités de ces modules sont
+# prioritaires dans cet ordre, devant les autres unités.
+UNIT_MODULES = ('general', 'geometry', 'heat', 'electricity', 'light')
+_PACKAGE = __name__.rpartition('.')[0]
+
+
+def _import_units():
+    for module in UNIT_MODULES:
+        import_module('.' + module, _PACKAGE)
+
+
+def _units():
+    """Obtenir les unités connues par ordre de priorité : celles des
+    modules de `UNIT_MODULES` dans l'ordre des modules, puis les autres,
+    chacune dans l'ordre de leur définition."""
+    ranks = dict((_PACKAGE + '.' + module, rank)
+                 for (rank, module) in enumerate(UNIT_MODULES))
+    units = list(UnitBase.units.values())
+    return sorted(units, key=lambda unit: (
+        ranks.get(unit.__module__, len(ranks)), units.index(unit)))
+
+
+def _find(name):
+    """Trouver parmi les unités connues celle à laquelle appartient un nom
+    de conversion. Les symboles respectant la casse sont prioritaires, puis
+    les clés des dictionnaires `convert` sans tenir compte de la casse, puis
+    les noms préfixés, comme pour les conversions des unités ; à égalité,
+    l'ordre de `UNIT_MODULES` s'applique."""
+    units = [unit for unit in _units() if not unit._derived]
+    for unit in units:
+        if unit.symbol == name:
+            return unit
+    for unit in units:
+        if name.lower() in unit._converters and name != 'value':
+            return unit
+    for unit in units:
+        if unit.symbol and name.endswith(unit.symbol) and \
+                unit._prefix(name)[0] is not None:
+            return unit
+    for unit in units:
+        if unit._prefix(name)[0] is not None:
+            return unit
+    raise ValueError("Unknown unit {0}".format(name))
+
+
+def _compile(expression, unit):
+    """Analyser une expression d'unité et obtenir le constructeur du
+    résultat et la conversion de la valeur vers l'unité du système
+    international."""
+    if not expression:
+        if unit is not None:
+            raise ValueError("Missing unit in measure")
+        return (float, float)
+    if unit is not None and unit._conversion(expression)[0] is not None:
+        return (unit.from_si, unit._conversion(expression)[0])
+    expression = expression.replace('**', '^')
+    parts = _SEPARATORS.split(expression)
+    terms = [(parts[0], 1)] + [(parts[i + 1], -1 if parts[i] == '/' else 1)
+                               for i in range(1, len(parts), 2)]
+    (dimension, factor) = ((), 1.0)
+    for (term, sign) in terms:
+        match = _TERM.match(term)
+        if match is None:
+            raise ValueError("Invalid unit expression {0}".format(expression))
+        (name, exponent) = (match.group(1), int(match.group(2) or 1))
+        termunit = _find(name)
+        if len(terms) == 1 and exponent == 1:
+            if unit is not None:
+                raise ValueError("{0} is not a unit of {1}".format(
+                    expression, unit.__name__))
+            return (termunit.from_si, termunit._conversion(name)[0])
+        termfactor = termunit._factor(name)
+        if termfactor is None or termunit._dimension is None:
+            raise ValueError("Cannot combine {0} in {1}".format(
+                name, expression))
+        dimension = _combine(dimension, termunit._dimension, sign * exponent)
+        factor *= termfactor ** (sign * exponent)
+    result = UnitBase.quantity(dimension)
+    if unit is not None and result is not unit:
+        raise ValueError("{0} is not a unit of {1}".format(
+            expression, unit.__name__))
+    return (float if result is float else result.from_si,
+            lambda v: v * factor)
+
+
+def parse(text, unit=None):
+    """Convertir une mesure textuelle en unité. L'expression d'unité peut
+    combiner des noms de conversion à l'aide de `*`, `.` et `/`, avec des
+    exposants notés `^` ou `**` : "1.4 m/s^2". Une unité attendue peut être
+    indiquée pour lever les ambiguïtés entre unités de même symbole ; une
+    ValueError est levée si la mesure ne lui correspond pas. Les modules de
+    `UNIT_MODULES` sont importés à la première analyse."""
+    match = _MEASURE.match(text)
+    if match is None:
+        raise ValueError("Invalid measure {0}".format(text))
+    (value, expression) = match.groups()
+    if _REVISION[0] != UnitBase.revision:
+        _import_units()
+        _COMPILED.clear()
+        _REVISION[0] = UnitBase.revision
+    compiled = _COMPILED.get((expression, unit))
+    if compiled is None:
+        compiled = _COMPILED[(expression, unit)] = \
+            _compile(expression, unit)
+    (build, tosi) = compiled
+    return build(tosi(float(value)))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Réductions de séquences d'unités de même type. Le type est vérifié une
+seule fois, puis les valeurs du système international sont accumulées sans
+créer d'unités intermédiaires ; les sommes sont calculées par `math.fsum`
+ou par sommation compensée de Neumaier, sans erreur d'arrondi cumulée.
+Toutes les fonctions acceptent des générateurs."""
+
+from math import fsum
+from . import Unit
+
+_builtin_min = min
+_builtin_max = max
+
+# Marqueur de fin d'un itérateur
+_MISSING = object()
+
+
+def _values(units, unit=None):
+    """Obtenir le type des unités d'un itérable et un générateur de leurs
+    valeurs. Une TypeError est levée au premier élément d'un autre type.
+    Si l'itérable est vide, `unit` est renvoyé avec un générateur vide, ou
+    une ValueError est levée si `unit` n'est pas indiqué."""
+    iterator = iter(units)
+    for first in iterator:
+        break
+    else:
+        if unit is None:
+            raise ValueError("Empty sequence of units")
+        return (unit, iter(()))
+    if not isinstance(first, Unit) or unit is not None and \
+            type(first)._unit is not unit:
+        raise TypeError("Cannot reduce {0}".format(type(first).__name__))
+    unit = type(first)._unit
+
+    def values():
+        yield first.value
+        for element in iterator:
+            if type(element) is not unit and \
+                    getattr(type(element), '_unit', None) is not unit:
+                raise TypeError("Cannot reduce {0} with {1}".format(
+                    type(element).__name__, unit.__name__))
+            yield element.value
+    return (unit, values())
+
+
+def usum(units, unit=None):
+    """Somme d'unités de même type. `unit` désigne le type attendu, et le
+    type du résultat nul d'une somme vide."""
+    (unit, values) = _values(units, unit)
+    return unit.from_si(fsum(values))
+
+
+def mean(units):
+    """Moyenne d'unités de même type."""
+    (unit, values) = _values(units)
+    count = [0]
+
+    def counted():
+        for value in values:
+            count[0] += 1
+            yield value
+    total = fsum(counted())
+    return unit.from_si(total / count[0])
+
+
+def min(units):
+    """Plus petite d'unités de même type."""
+    (unit, values) = _values(units)
+    return unit.from_si(_builtin_min(values))
+
+
+def max(units):
+    """Plus grande d'unités de même type."""
+    (unit, values) = _values(units)
+    return unit.from_si(_builtin_max(values))
+
+
+def _add(total, compensation, value):
+    """Ajouter une valeur à une somme compensée de Neumaier, représentée par
+    la somme et la compensation des erreurs d'arrondi."""
+    result = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - result) + value
+    else:
+        compensation += (value - result) + total
+    return (result, compensation)
+
+
+def weighted_mean(units, weights):
+    """Moyenne d'unités de même type pondérée par des nombres. Les sommes
+    des produits et des poids sont accumulées en une seule passe, sans
+    conserver les valeurs. Une ValueError est levée si les unités et les
+    poids ne sont pas en même nombre."""
+    (unit, values) = _values(units)
+    weights = iter(weights)
+    (products, compensation) = (0.0, 0.0)
+    (total, total_compensation) = (0.0, 0.0)
+    for value in values:
+        weight = next(weights, _MISSING)
+        if weight is _MISSING:
+            raise ValueError("Fewer weights than units")
+        (products, compensation) = _add(products, compensation,
+                                        value * weight)
+        (total, total_compensation) = _add(total, total_compensation,
+                                           weight)
+    if next(weights, _MISSING) is not _MISSING:
+        raise ValueError("More weights than units")
+    total += total_compensation
+    if not total:
+        raise ValueError("Weights sum to zero")
+    return unit.from_si((products + compensation) / total)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Sérialisation binaire compacte des unités. Une unité est représentée par
+un en-tête portant la référence de sa classe, suivi de sa valeur dans le
+système international sous forme de flottant double précision
+petit-boutiste ; une séquence d'unités de même type ou un tableau d'unités
+partage un unique en-tête suivi du tampon de ses valeurs. La référence d'une
+unité nommée indique le module qui la définit, importé si nécessaire à la
+lecture ; celle d'une unité dérivée anonyme indique sa dimension. Comme
+pour pickle, seules des données sûres doivent être lues.
+
+    data = dumps([Time(s=1), Time(h=2)])
+    loads(data)  # [<Time 1.0 seconds>, <Time 7200.0 seconds>]
+"""
+
+import struct
+import sys
+from array import array
+from importlib import import_module
+from . import Unit, UnitBase
+
+# En-tête : signature, version, nature du contenu, longueur de la référence
+# d'unité
+_HEADER = struct.Struct('<2sBcH')
+_MAGIC = b'PU'
+_VERSION = 2
+# Versions lisibles ; la version 1 ne porte que le nom des unités
+_VERSIONS = (1, 2)
+_COUNT = struct.Struct('<Q')
+_VALUE = struct.Struct('<d')
+
+# Natures de contenu
+_UNIT = b'u'
+_LIST = b'l'
+_ARRAY = b'a'
+
+
+def _tobytes(values):
+    """Obtenir les octets petit-boutistes d'un tableau `array('d')`."""
+    if sys.byteorder != 'little':
+        values = array('d', values)
+        values.byteswap()
+    return values.tobytes() if hasattr(values, 'tobytes') \
+        else values.tostring()
+
+
+def _frombytes(data):
+    """Reconstituer un tableau `array('d')` à partir d'octets
+    petit-boutistes."""
+    values = array('d')
+    if hasattr(values, 'frombytes'):
+        values.frombytes(data)
+    else:
+        values.fromstring(data)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def reference(unit):
+    """Obtenir la référence textuelle d'une unité : `module:Nom` pour une
+    unité nommée, `:base=exposant,...` pour une unité dérivée anonyme."""
+    if unit._derived:
+        return ':' + ','.join('{0}={1}'.format(base, exp)
+                              for (base, exp) in unit._dimension)
+    return '{0}:{1}'.format(unit.__module__, unit.__name__)
+
+
+def resolve(ref):
+    """Obtenir l'unité désignée par une référence obtenue par `reference`,
+    en important son module si nécessaire. Une ValueError est levée si
+    l'unité est introuvable."""
+    (module, _, name) = ref.rpartition(':')
+    if not module and ref.startswith(':'):  # Unité dérivée
+        try:
+            return UnitBase.quantity(dict(
+                (base, int(exp)) for (base, exp)
+                in (item.rsplit('=', 1) for item in name.split(','))))
+        except ValueError:
+            raise ValueError("Invalid unit reference {0}".format(ref))
+    unit = UnitBase.units.get(name)
+    if module and (unit is None or unit.__module__ != module):
+        try:
+            unit = getattr(import_module(module), name, None)
+        except ImportError:
+            unit = None
+    if not isinstance(unit, UnitBase):
+        raise ValueError("Unknown unit {0}".format(ref))
+    return unit
+
+
+def _header(kind, unit):
+    name = reference(unit).encode('utf-8') if unit is not None else b''
+    return _HEADER.pack(_MAGIC, _VERSION, kind, len(name)) + name
+
+
+def dumps(obj):
+    """Sérialiser une unité, une séquence d'unités de même type ou un tableau
+    d'unités."""
+    if isinstance(obj, Unit):
+        return _header(_UNIT, type(obj)._unit) + _VALUE.pack(obj.value)
+    unit = getattr(type(obj), 'unit', None)
+    if isinstance(unit, UnitBase):  # Tableau d'unités
+        values = obj.values.astype('<f8')
+        return _header(_ARRAY, unit) + _COUNT.pack(len(values)) + \
+            values.tobytes()
+    values = array('d')
+    unit = None
+    for element in obj:
+        if type(element) is not unit:
+            if not isinstance(element, Unit) or unit is not None and \
+                    type(element)._unit is not unit:
+                raise TypeError("Cannot serialize {0}".format(
+                    type(element).__name__))
+            unit = type(element)._unit
+        values.append(element.value)
+    return _header(_LIST, unit) + _COUNT.pack(len(values)) + \
+        _tobytes(values)
+
+
+def loads(data):
+    """Reconstituer une unité, une liste d'unités ou un tableau d'unités
+    sérialisé par `dumps`."""
+    data = memoryview(data)
+    try:
+        (magic, version, kind, size) = _HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("Truncated unit data")
+    if magic != _MAGIC or version not in _VERSIONS:
+        raise ValueError("Invalid unit data")
+    offset = _HEADER.size + size
+    name = data[_HEADER.size:offset].tobytes().decode('utf-8')
+    if name:
+        unit = resolve(name)
+    elif kind == _LIST:  # Liste vide
+        unit = None
+    else:
+        raise ValueError("Unknown unit")
+    try:
+        if kind == _UNIT:
+            return unit.from_si(_VALUE.unpack_from(data, offset)[0])
+        (count, ) = _COUNT.unpack_from(data, offset)
+    except struct.error:
+        raise ValueError("Truncated unit data")
+    offset += _COUNT.size
+    payload = data[offset:offset + count * _VALUE.size].tobytes()
+    if len(payload) != count * _VALUE.size:
+        raise ValueError("Truncated unit data")
+    if kind == _ARRAY:
+        import numpy
+        from .arrays import UnitArray
+        return UnitArray.of(unit).from_si(
+            numpy.frombuffer(payload, dtype='<f8').astype(numpy.float64))
+    if kind != _LIST:
+        raise ValueError("Invalid unit data")
+    build = unit.from_si if unit is not None else None
+    return [build(value) for value in _frombytes(payload)]
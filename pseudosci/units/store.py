@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Stockage persistant de colonnes de mesures. Chaque colonne est enregistrée
+dans un dossier sous forme d'un fichier brut de flottants double précision
+petit-boutistes exprimés dans l'unité du système international, accompagné
+d'un fichier JSON décrivant son unité, dont le module est importé à
+l'ouverture si nécessaire. Les colonnes sont rouvertes par projection en
+mémoire, sous forme de tableaux d'unités dont les valeurs ne sont lues qu'à
+l'accès. Le package Python `numpy` est requis.
+
+    store = UnitStore('ephemeris')
+    store.write('distance', distances)
+    store['distance'][100:200].km
+"""
+
+import json
+import os
+import sys
+from array import array
+import numpy
+from . import Unit
+from .arrays import UnitArray
+from .serial import reference, resolve
+
+_DTYPE = '<f8'
+
+
+class UnitStore(object):
+    """Ensemble de colonnes de mesures stockées dans le dossier `path`, créé
+    si nécessaire."""
+
+    def __init__(self, path):
+        self.path = path
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    def __repr__(self):
+        return '<{0} {1}>'.format(type(self).__name__, self.path)
+
+    def _files(self, name):
+        base = os.path.join(self.path, name)
+        return (base + '.f64', base + '.json')
+
+    def _metadata(self, name):
+        """Lire la description d'une colonne, où l'unité est remplacée par
+        la classe correspondante."""
+        try:
+            with open(self._files(name)[1]) as f:
+                metadata = json.load(f)
+        except IOError:
+            raise KeyError(name)
+        if metadata.get('dtype') != _DTYPE:
+            raise ValueError("Invalid column {0}".format(name))
+        try:
+            metadata['unit'] = resolve(metadata.get('unit', ''))
+        except ValueError:
+            raise ValueError("Invalid column {0}".format(name))
+        return metadata
+
+    def _describe(self, name, unit, count):
+        with open(self._files(name)[1], 'w') as f:
+            json.dump({'unit': reference(unit), 'count': count,
+                       'dtype': _DTYPE}, f)
+
+    def names(self):
+        """Obtenir la liste triée des noms de colonnes."""
+        return sorted(f[:-5] for f in os.listdir(self.path)
+                      if f.endswith('.json') and not f.startswith('.'))
+
+    def __contains__(self, name):
+        return os.path.exists(self._files(name)[1])
+
+    def __iter__(self):
+        return iter(self.names())
+
+    def unit(self, name):
+        """Obtenir l'unité d'une colonne."""
+        return self._metadata(name)['unit']
+
+    def write(self, name, units, chunksize=65536):
+        """Enregistrer une colonne, en remplaçant la colonne existante de même
+        nom. `units` est un tableau d'unités ou un itérable d'unités de même
+        type, lu par blocs de `chunksize` éléments. La colonne est écrite
+        sous un nom temporaire, puis renommée une fois complète : la colonne
+        existante est conservée en cas d'erreur."""
+        partial = '.' + name + '.partial'
+        self.delete(partial)
+        count = self.append(partial, units, chunksize)
+        (data, metadata) = self._files(name)
+        if os.path.exists(metadata):
+            os.remove(metadata)
+        replace = getattr(os, 'replace', os.rename)
+        for (source, target) in zip(self._files(partial), (data, metadata)):
+            replace(source, target)
+        return count
+
+    def append(self, name, units, chunksize=65536):
+        """Ajouter des mesures à la fin d'une colonne, en la créant si
+        nécessaire. Renvoie le nombre total de mesures de la colonne."""
+        created = name not in self
+        if created:
+            (unit, count) = (None, 0)
+        else:
+            metadata = self._metadata(name)
+            (unit, count) = (metadata['unit'], metadata['count'])
+        try:
+            return self._append(name, units, chunksize, unit, count)
+        except BaseException:
+            if created:  # Ne pas laisser de données orphelines
+                self.delete(name)
+            raise
+
+    def _append(self, name, units, chunksize, unit, count):
+        with open(self._files(name)[0], 'ab') as f:
+            # Ignorer les données d'un ajout précédent interrompu
+            f.truncate(count * 8)
+            if isinstance(units, UnitArray):
+                if unit is not None and units.unit is not unit:
+                    raise TypeError("Cannot store {0} in a column of "
+                                    "{1}".format(units.unit.__name__,
+                                                 unit.__name__))
+                unit = units.unit
+                units.values.astype(_DTYPE).tofile(f)
+                count += len(units)
+            else:
+                chunk = array('d')
+                for element in units:
+                    if type(element) is not unit:
+                        if not isinstance(element, Unit) or \
+                                unit is not None and \
+                                type(element)._unit is not unit:
+                            raise TypeError("Cannot store {0}".format(
+                                type(element).__name__))
+                        unit = type(element)._unit
+                    chunk.append(element.value)
+                    if len(chunk) == chunksize:
+                        count += self._flush(f, chunk)
+                        chunk = array('d')
+                count += self._flush(f, chunk)
+        if unit is None:
+            raise ValueError("Cannot create empty column {0} without "
+                             "unit".format(name))
+        self._describe(name, unit, count)
+        return count
+
+    @staticmethod
+    def _flush(f, chunk):
+        if sys.byteorder != 'little':
+            chunk.byteswap()
+        chunk.tofile(f)
+        return len(chunk)
+
+    def open(self, name, writable=False):
+        """Ouvrir une colonne sous forme de tableau d'unités projeté en
+        mémoire. Les modifications d'un tableau ouvert en écriture sont
+        répercutées dans le fichier."""
+        metadata = self._metadata(name)
+        unit = metadata['unit']
+        if not metadata['count']:
+            return UnitArray.of(unit).from_si(numpy.empty(0))
+        values = numpy.memmap(self._files(name)[0], dtype=_DTYPE,
+                              mode='r+' if writable else 'r',
+                              shape=(metadata['count'], ))
+        return UnitArray.of(unit).from_si(values)
+
+    def __getitem__(self, name):
+        return self.open(name)
+
+    def delete(self, name):
+        """Supprimer une colonne, si elle existe."""
+        for path in self._files(name):
+            if os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""Configuration des tests des unités. Les taux de change sont fictifs : un
+instantané récent est placé dans un dossier temporaire avant l'importation
+de pseudosci.units.money, qui ne contacte ainsi aucun service et n'écrit
+pas dans l'instantané de l'utilisateur."""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import pytest
+
+RATES = {'USD': 1, 'EUR': 0.9, 'GBP': 0.8, 'JPY': 150.0, 'BTC': 1.6e-5}
+
+_DIRECTORY = tempfile.mkdtemp(prefix='pseudosci-')
+RATES_PATH = os.path.join(_DIRECTORY, 'provider.json')
+with open(RATES_PATH, 'w') as f:
+    json.dump(RATES, f)
+os.environ['PSEUDOSCI_RATES'] = os.path.join(_DIRECTORY, 'rates.json')
+with open(os.environ['PSEUDOSCI_RATES'], 'w') as f:
+    json.dump({'timestamp': time.time(), 'rates': RATES}, f)
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(_DIRECTORY, ignore_errors=True)
+
+
+@pytest.fixture
+def rates(tmpdir, monkeypatch):
+    """Obtenir les taux de change d'un fournisseur fictif lisant `RATES`, et
+    placer l'instantané dans un dossier temporaire. Les taux de Currency
+    sont rétablis après le test."""
+    from .. import money
+    monkeypatch.setattr(money, '_PROVIDER',
+                        [money.file_provider(RATES_PATH)])
+    monkeypatch.setattr(money, 'SNAPSHOT_PATH',
+                        str(tmpdir.join('rates.json')))
+    monkeypatch.setattr(money.Currency, 'convert', money.Currency.convert)
+    return RATES
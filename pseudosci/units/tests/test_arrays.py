@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import pytest
+numpy = pytest.importorskip('numpy')
+
+from .. import _OPERATIONS  # noqa: E402
+from ..arrays import UnitArray  # noqa: E402
+from ..general import Distance, Time, Velocity, Area, Frequency, \
+    MI_M  # noqa: E402
+from ..heat import Temperature, C_K  # noqa: E402
+
+
+class TestUnitArray:
+    """Tests de la classe pseudosci.units.arrays.UnitArray"""
+
+    def test_of(self):
+        """Tests des types de tableaux spécialisés."""
+        DistanceArray = UnitArray.of(Distance)
+        assert DistanceArray is UnitArray.of(Distance)
+        assert DistanceArray.__name__ == 'DistanceArray'
+        assert DistanceArray.unit is Distance
+        assert issubclass(DistanceArray, UnitArray)
+
+    def test_init(self):
+        """Tests des constructeurs des tableaux."""
+        d = UnitArray.of(Distance)(km=[1, 2, 3])
+        assert d.values.dtype == numpy.float64
+        assert list(d.values) == [1000.0, 2000.0, 3000.0]
+        assert list(UnitArray.of(Distance).from_si([1, 2]).m) == [1.0, 2.0]
+        u = UnitArray.of(Distance).from_units(Distance(m=i) for i in range(3))
+        assert list(u.m) == [0.0, 1.0, 2.0]
+        u = UnitArray.of(Distance).from_units([Distance.constant(m=1)])
+        assert list(u.m) == [1.0]
+        with pytest.raises(TypeError):
+            UnitArray.of(Distance).from_units([Distance(m=1), Time(s=1)])
+        with pytest.raises(TypeError):
+            UnitArray.of(Distance).from_units([1.0])
+        t = UnitArray.of(Temperature)(c=[0, 100])
+        assert list(t.k) == [C_K, 100 + C_K]
+        with pytest.raises(ValueError):
+            UnitArray.of(Distance)(pouet=[1])
+        assert not hasattr(d, '__dict__')
+
+    def test_attributes(self):
+        """Tests des attributs de conversion des tableaux."""
+        d = UnitArray.of(Distance)(mi=[1, 2])
+        assert list(d.m) == [MI_M, 2 * MI_M]
+        assert list(d.MI) == [1.0, 2.0]
+        d.km = [1, 2]
+        assert list(d.m) == [1000.0, 2000.0]
+        with pytest.raises(AttributeError):
+            d.pouet
+        with pytest.raises(AttributeError):
+            d.pouet = 3
+
+    def test_sequence(self):
+        """Tests de l'accès aux éléments des tableaux."""
+        d = UnitArray.of(Distance)(m=[1, 2, 3, 4])
+        assert len(d) == 4
+        assert d[0] == Distance(m=1)
+        assert list(d) == [Distance(m=i) for i in range(1, 5)]
+        assert list(d[1:3].m) == [2.0, 3.0]
+        assert list(d[d > Distance(m=2)].m) == [3.0, 4.0]
+        d[0] = Distance(km=1)
+        assert d[0].m == 1000.0
+        with pytest.raises(TypeError):
+            d[0] = Time(s=1)
+
+    def test_math(self):
+        """Tests des opérations mathématiques des tableaux."""
+        d = UnitArray.of(Distance)(m=[2, 4])
+        t = UnitArray.of(Time)(s=[1, 2])
+        v = d / t
+        assert type(v) is UnitArray.of(Velocity)
+        assert list(v.mps) == [2.0, 2.0]
+        assert type(d * d) is UnitArray.of(Area)
+        assert type(d / Time(s=2)) is UnitArray.of(Velocity)
+        assert type(Distance(m=2) / t) is UnitArray.of(Velocity)
+        assert type(1 / t) is UnitArray.of(Frequency)
+        assert list((Distance(m=8) - d).m) == [6.0, 4.0]
+        assert list((d + Distance(m=1)).m) == [3.0, 5.0]
+        assert list((2 * d).m) == [4.0, 8.0]
+        assert list((numpy.array([1, 2]) * d).m) == [2.0, 8.0]
+        assert list(d / d) == [1.0, 1.0]
+        assert type(d ** 2) is UnitArray.of(Area)
+        assert list((d * d) ** 0.5) == [Distance(m=2), Distance(m=4)]
+        with pytest.raises(ValueError):
+            (-d * d) ** 0.5
+        # Les types de résultat sont mémorisés avec les opérations des
+        # unités, et oubliés avec elles
+        assert (Distance, Time, 'array truediv') in _OPERATIONS
+        assert list((-d).m) == [-2.0, -4.0]
+        assert list(abs(-d).m) == [2.0, 4.0]
+        with pytest.raises(TypeError):
+            d + t
+        with pytest.raises(TypeError):
+            d + "pouet"
+
+    def test_reductions(self):
+        """Tests des réductions des tableaux."""
+        d = UnitArray.of(Distance)(m=[1, 2, 3, 6])
+        assert d.sum() == Distance(m=12)
+        assert d.mean() == Distance(m=3)
+        assert d.min() == Distance(m=1)
+        assert d.max() == Distance(m=6)
+        assert type(d.std()) is Distance
+
+    def test_compare(self):
+        """Tests des comparaisons des tableaux."""
+        d = UnitArray.of(Distance)(m=[1, 2, 3])
+        assert list(d == Distance(m=2)) == [False, True, False]
+        assert list(d != d) == [False, False, False]
+        assert list(d <= Distance(m=2)) == [True, True, False]
+        assert list(d >= Distance(m=2)) == [False, True, True]
+        assert list(d < d) == [False, False, False]
+        assert (d == Time(s=2)) is False
+
+    def test_convert_many(self):
+        """Tests de la conversion vectorisée de tableaux NumPy."""
+        result = Distance.convert_many(numpy.array([1, 2]), 'km', 'm')
+        assert isinstance(result, numpy.ndarray)
+        assert list(result) == [1000.0, 2000.0]
+        result = Temperature.convert_many(numpy.array([0.0]), 'c')
+        assert list(result) == [C_K]
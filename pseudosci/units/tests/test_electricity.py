@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 
-from .. import Unit
+from .. import Unit, ConversionAttribute
 from ..electricity import Voltage, STATV_V, ABV_V, Current, ABA_A, \
     STATA_A, Capacity, ABF_F, STATF_F, JAR_F, Resistance, \
     ABOHM_OHM, STATOHM_OHM, Charge, ABC_C, STATC_C, AH_C, Conductance, \
@@ -20,6 +20,38 @@ class TestUnitsElectricity:
         with pytest.raises(ValueError):
             Voltage()
 
+    def test_prefixes(self):
+        """Tests des conversions préfixées."""
+        assert Voltage(mV=1500).v == 1.5
+        assert Voltage(kV=1.5).v == 1500.0
+        assert Current(MA=1).a == 1e-3
+        assert Current(GA=1).a == 1e9
+        assert Current(mA=1).a == 1e-3
+        assert Current(a=2).mA == 2000.0
+        assert 'GA' in Current._prefixed
+        assert 'mA' not in Current._prefixed
+        assert Current(uA=3).ma == 3e-3
+        with pytest.raises(ValueError):
+            Current(XA=1)
+        with pytest.raises(AttributeError):
+            Current(a=1).kohm
+        current = Current(a=1)
+        current.ma = 5
+        assert current.a == 5e-3
+        current.mA = 6
+        assert current.a == 6e-3
+        current.kA = 2
+        assert current.a == 2000.0
+        assert isinstance(vars(Current)['kA'], ConversionAttribute)
+        resistance = Resistance(ohm=1)
+        resistance.kohm = 2
+        assert resistance.ohm == 2000.0
+        assert Capacity(mf=1).f == 1e-6
+        assert Capacity(mF=1).f == 1e-6
+        assert Capacity(MF=1).f == 1e-6
+        assert Capacity(uF=1).f == 1e-6
+        assert Capacity(nF=1).f == pytest.approx(1e-9)
+
     def test_current(self):
         """Tests de Current."""
         assert issubclass(Current, Unit)
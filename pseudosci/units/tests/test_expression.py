@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+from fractions import Fraction
+from ..expression import lazy, Expression, _COMPILED
+from ..general import Distance, Time, Velocity, Acceleration, Mass, Area, \
+    Energy
+import pytest
+
+
+class TestExpression:
+    """Tests des expressions différées de pseudosci.units.expression"""
+
+    def test_types(self):
+        """Tests de la détermination des types lors de la construction."""
+        (m, v) = (Mass(kg=2), Velocity(mps=3))
+        expression = lazy(m) * v * v / 2
+        assert isinstance(expression, Expression)
+        assert expression.unit is Energy
+        assert (lazy(Distance(m=3)) / Time(s=2)).unit is Velocity
+        assert (2 * lazy(Distance(m=3)) / Distance(m=1)).unit is float
+        assert (1 / lazy(Time(s=2)) * Velocity(mps=1)).unit is Acceleration
+        assert (lazy(Distance(m=3)) ** 2).unit is Area
+        with pytest.raises(TypeError):
+            lazy(Distance(m=3)) + Time(s=2)
+        with pytest.raises(TypeError):
+            lazy(Distance(m=3)) * "pouet"
+        with pytest.raises(TypeError):
+            lazy("pouet")
+
+    def test_evaluate(self):
+        """Tests de l'évaluation des expressions."""
+        (m, v) = (Mass(kg=2), Velocity(mps=3))
+        assert (lazy(m) * v * v / 2).evaluate() == m * v * v / 2
+        (d, t) = (Distance(m=10), Time(s=4))
+        assert (lazy(d) / t - Velocity(mps=1)).evaluate() == Velocity(mps=1.5)
+        assert (-lazy(d) + 1).evaluate() == Distance(m=-9)
+        assert abs(lazy(d) - Distance(m=12)).evaluate() == Distance(m=2)
+        assert (d // lazy(Distance(m=3))).evaluate() == 3
+        assert (10 - lazy(Distance(m=3))).evaluate() == Distance(m=7)
+        assert (lazy(Distance(m=3)) ** 2).evaluate() == Area(m2=9)
+        assert (lazy(Area(m2=9)) ** Fraction(1, 2)).evaluate() == \
+            Distance(m=3)
+        assert (lazy(4.0) ** 0.5).evaluate() == 2.0
+        with pytest.raises(ValueError):
+            lazy(Area(m2=9)) ** float('inf')
+        with pytest.raises(ValueError):
+            lazy(2.0) ** float('nan')
+        with pytest.raises(ValueError):
+            (lazy(Area(m2=-9)) ** 0.5).evaluate()
+        with pytest.raises(ValueError):
+            (lazy(-4.0) ** 0.5).evaluate()
+
+    def test_compiled(self):
+        """Tests de la compilation unique des expressions."""
+        _COMPILED.clear()
+        (lazy(Distance(m=1)) / Time(s=1)).evaluate()
+        (lazy(Distance(m=4)) / Time(s=2)).evaluate()
+        assert list(_COMPILED.keys()) == ['(a0 / a1)']
+
+    def test_arrays(self):
+        """Tests de l'évaluation sur des tableaux d'unités."""
+        arrays = pytest.importorskip('pseudosci.units.arrays')
+        distances = arrays.UnitArray.of(Distance)(m=[1, 2, 3])
+        result = (lazy(distances) / Time(s=2) * 2).evaluate()
+        assert type(result) is arrays.UnitArray.of(Velocity)
+        assert list(result.values) == [1, 2, 3]
+        areas = arrays.UnitArray.of(Area)(m2=[4, -9])
+        with pytest.raises(ValueError):
+            (lazy(areas) ** 0.5).evaluate()
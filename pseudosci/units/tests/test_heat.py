@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 
-from .. import Unit
-from ..heat import Temperature, Pressure, C_K, HPA_PA, BAR_PA, ATM_PA
+from .. import Unit, Affine
+from ..heat import Temperature, Pressure, C_K, HPA_PA, BAR_PA, ATM_PA, \
+    CELSIUS, FAHRENHEIT
 import pytest
 
 
@@ -28,6 +29,25 @@ class TestUnitsHeat:
         assert Temperature.celsius2kelvin(-273.15) == 0.0
         assert round(Temperature.kelvin2fahrenheit(0.0), 5) == -459.67
 
+    def test_temperature_convert_many(self):
+        """Tests de la conversion de séquences de températures."""
+        assert list(Temperature.convert_many([0, 100], 'c', 'k')) == \
+            [C_K, 100 + C_K]
+        assert [round(v, 5) for v in
+                Temperature.convert_many([32, 212], 'f', 'c')] == [0, 100]
+
+    def test_temperature_affine(self):
+        """Tests des conversions affines de Temperature."""
+        assert Temperature.affine('c') == CELSIUS
+        assert Temperature.affine('f', 'c') == Affine(5.0 / 9.0, 0, 32)
+        assert Temperature.affine('f', 'c')(212) == 100
+        assert Temperature.affine('f', 'c').delta(18) == 10
+        assert Temperature.affine('c', 'k').delta(10) == 10
+        assert round(Temperature.affine('c', 'f')(100), 10) == 212
+        assert Temperature.affine('mK', 'k')(1000) == 1
+        assert round(FAHRENHEIT.inverted()(C_K), 10) == 32
+        assert Temperature(c=10).f == FAHRENHEIT.inverse(10 + C_K)
+
     def test_pressure(self):
         """Tests de Pression."""
         assert issubclass(Pressure, Unit)
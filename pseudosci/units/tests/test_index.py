@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+from .. import UnitIndex
+from ..general import Distance, Time
+from ...movement import Movement
+import pytest
+
+
+class TestUnitIndex:
+    """Tests de la classe pseudosci.units.UnitIndex"""
+
+    def test_range(self):
+        """Tests des requêtes par intervalle."""
+        index = UnitIndex(Time(h=h) for h in [3, 1, 2.5, 2, 4])
+        assert list(index) == [Time(h=h) for h in [1, 2, 2.5, 3, 4]]
+        assert index.range(Time(h=2), Time(h=3)) == \
+            [Time(h=2), Time(h=2.5), Time(h=3)]
+        assert index.range(high=Time(h=1.5)) == [Time(h=1)]
+        assert index.range(Time(h=5)) == []
+        assert index.range(Time(h=3), Time(h=2)) == []
+        assert index.count(Time(h=2)) == 4
+        assert (index.min(), index.max()) == (Time(h=1), Time(h=4))
+        assert UnitIndex().range(Time(s=1)) == []
+        with pytest.raises(TypeError):
+            index.range(Distance(m=1))
+
+    def test_update(self):
+        """Tests de l'ajout et du retrait d'éléments."""
+        index = UnitIndex(unit=Time)
+        index.add(Time(s=2))
+        index.add(Time(s=1))
+        assert list(index) == [Time(s=1), Time(s=2)]
+        index.remove(Time(s=2))
+        assert len(index) == 1
+        with pytest.raises(ValueError):
+            index.remove(Time(s=5))
+        with pytest.raises(TypeError):
+            index.add(Distance(m=1))
+
+    def test_key(self):
+        """Tests de l'indexation par une clé."""
+        movements = [Movement(distance=Distance(km=d), time=Time(h=d))
+                     for d in range(1, 6)]
+        index = UnitIndex(movements, key=lambda m: m.time)
+        assert index.range(Time(h=2), Time(h=3)) == movements[1:3]
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+from .. import UnitBase, Unit
+from ..general import Distance, Time, Velocity
+import pytest
+
+
+class TestInstrumentation:
+    """Tests de l'instrumentation des unités."""
+
+    def test_counts(self):
+        """Tests du comptage des opérations."""
+        (d, t) = (Distance(m=10), Time(s=2))
+        with UnitBase.instrumented() as stats:
+            v = d / t
+            v.kph
+            v.kph = 36
+            d.convertto('km')
+            with pytest.raises(AttributeError):
+                d.pouet
+            with pytest.raises(TypeError):
+                d + t
+            Distance(km=1)
+        assert stats['Distance', '__truediv__'] == 1
+        assert stats['Velocity', 'from_si'] == 1
+        assert stats['Velocity', 'get kph'] == 1
+        assert stats['Velocity', 'set kph'] == 1
+        assert stats['Velocity', '__getattr__'] == 0
+        assert stats['Distance', 'convertto'] == 1
+        assert stats['Distance', '__getattr__ failed'] == 1
+        assert stats['Distance', '__add__ NotImplemented'] == 1
+        assert stats['Time', '__radd__ NotImplemented'] == 1
+        assert stats['Distance', '__init__'] == 1
+        assert stats['Distance', 'convertfrom'] == 1
+        assert stats.total('__truediv__') == 1
+        report = stats.report().splitlines()
+        assert report[0].split() == ['Unit', 'Operation', 'Count']
+        assert len(report) == len(stats.counts) + 1
+        assert report[1].split()[:2] == ['Distance', '__add__']
+
+    def test_disabled(self):
+        """Tests du rétablissement des méthodes d'origine."""
+        methods = (vars(Distance)['__add__'], vars(Distance)['from_si'])
+        with UnitBase.instrumented() as outer:
+            with UnitBase.instrumented() as inner:
+                Distance(m=1) + Distance(m=2)
+            Distance(m=1) + Distance(m=2)
+
+            class UnitInstrumented(Unit):
+                fullname = "unit"
+                pluralname = "units"
+
+            UnitInstrumented(value=1) == UnitInstrumented(value=1)
+        UnitInstrumented(value=1) == UnitInstrumented(value=1)
+        assert inner['Distance', '__add__'] == 1
+        assert outer['Distance', '__add__'] == 2
+        assert outer['UnitInstrumented', '__eq__'] == 1
+        assert (vars(Distance)['__add__'], vars(Distance)['from_si']) == \
+            methods
+        assert not UnitBase.hooks
+        assert Distance(m=1) / Time(s=1) == Velocity(mps=1)
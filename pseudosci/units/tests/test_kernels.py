@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+from .. import boundary
+from ..general import Distance, Time, Velocity, Acceleration
+import pytest
+
+
+@boundary(distance=Distance, time=Time, returns=Velocity)
+def speed(distance, time):
+    assert type(distance) is float and type(time) is float
+    return distance / time
+
+
+@boundary(velocity=Velocity, time=Time,
+          returns=(Acceleration, Distance))
+def brake(velocity, time=None):
+    return (velocity / time, velocity * time / 2)
+
+
+class TestBoundary:
+    """Tests du décorateur pseudosci.units.boundary"""
+
+    def test_call(self):
+        """Tests de la conversion des arguments et du résultat."""
+        assert speed(Distance(km=3), Time(s=100)) == Velocity(mps=30)
+        assert speed(time=Time(s=2), distance=Distance(m=4)) == \
+            Velocity(mps=2)
+        assert speed.__name__ == 'speed'
+        assert brake(Velocity(mps=10), time=Time(s=4)) == \
+            (Acceleration(mpss=2.5), Distance(m=20))
+
+    def test_errors(self):
+        """Tests de la vérification des unités."""
+        with pytest.raises(TypeError):
+            speed(Time(s=3), Time(s=100))
+        with pytest.raises(TypeError):
+            speed(3, Time(s=100))
+        with pytest.raises(TypeError):
+            boundary(pouet=Distance)(lambda distance: distance)
+        pair = boundary(returns=(Distance, Time))(lambda: (1.0, ))
+        with pytest.raises(ValueError):
+            pair()
+
+    def test_arrays(self):
+        """Tests de l'appel avec des tableaux d'unités."""
+        arrays = pytest.importorskip('pseudosci.units.arrays')
+        distances = arrays.UnitArray.of(Distance)(m=[2, 4])
+        velocity = boundary(distance=Distance, time=Time, returns=Velocity)(
+            lambda distance, time: distance / time)
+        result = velocity(distances, Time(s=2))
+        assert type(result) is arrays.UnitArray.of(Velocity)
+        assert list(result.values) == [1, 2]
+
+    def test_numpy_scalars(self):
+        """Tests des résultats scalaires NumPy, convertis en unités."""
+        numpy = pytest.importorskip('numpy')
+        arrays = pytest.importorskip('pseudosci.units.arrays')
+        total = boundary(distance=Distance, returns=Distance)(
+            lambda distance: distance.sum())
+        result = total(arrays.UnitArray.of(Distance)(m=[2, 4]))
+        assert type(result) is Distance and result == Distance(m=6)
+        scalar = boundary(returns=Time)(lambda: numpy.array(3.0))
+        assert scalar() == Time(s=3)
+        assert type(scalar().value) is float
@@ -1,10 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 
-from .. import Unit
-from ..money import get_rates, Currency
+import os
+import threading
+from datetime import date, datetime
+from .. import Unit, money
+from ..money import get_rates, Currency, load_rates, set_provider, \
+    file_provider, publish_rates, RateRefresher, RateHistory
 import pytest
 
+pytestmark = pytest.mark.usefixtures('rates')
+
 
 class TestUnitsMoney:
     """Tests des unités de pseudosci.units.money."""
@@ -14,6 +20,7 @@ class TestUnitsMoney:
         rates = get_rates()
         assert rates.get('USD') == 1
         assert 'BTC' in rates
+        assert rates['EUR'] == 0.9
 
     def test_currency(self):
         """Tests de Currency."""
@@ -24,7 +31,165 @@ class TestUnitsMoney:
         # Vérifier tous les éléments sauf BTC (trop souvent mis à jour)
         assert sum(True for (k, v) in get_rates().items()
                    if k != 'BTC' and c.convert[k] != v) == 0
+        assert Currency(eur=1).usd == 0.9
+        assert os.path.exists(money.SNAPSHOT_PATH)
         with pytest.raises(ValueError):
             Currency()
         with pytest.raises(AttributeError):
             c.pouet
+
+
+class TestRatesSnapshot:
+    """Tests de l'instantané local des taux de change."""
+
+    def test_load_rates(self, tmpdir, monkeypatch):
+        """Tests du chargement des taux depuis l'instantané."""
+        calls = []
+
+        def provider():
+            calls.append(True)
+            return {'USD': 1, 'EUR': 2}
+        monkeypatch.setattr(money, '_PROVIDER', [provider])
+        path = str(tmpdir.join('cache', 'rates.json'))
+        assert load_rates(path=path) == {'USD': 1, 'EUR': 2}
+        assert load_rates(path=path) == {'USD': 1, 'EUR': 2}
+        assert len(calls) == 1
+        load_rates(ttl=0, path=path)
+        assert len(calls) == 2
+
+    def test_offline(self, tmpdir, monkeypatch):
+        """Tests du chargement des taux sans fournisseur disponible."""
+        path = str(tmpdir.join('rates.json'))
+        tmpdir.join('stub.json').write('{"USD": 1, "JPY": 3}')
+        set_provider(file_provider(str(tmpdir.join('stub.json'))))
+        try:
+            assert load_rates(path=path)['JPY'] == 3
+            set_provider(file_provider(str(tmpdir.join('pouet.json'))))
+            assert load_rates(ttl=0, path=path)['JPY'] == 3
+            with pytest.warns(UserWarning):
+                assert load_rates(path=path + '.pouet') == {'USD': 1}
+        finally:
+            set_provider(money.forex_provider)
+
+    def test_update_rates(self, tmpdir, monkeypatch):
+        """Tests de la mise à jour des taux de Currency."""
+        monkeypatch.setattr(money, '_PROVIDER', [lambda: {'USD': 1, 'EUR': 2}])
+        monkeypatch.setattr(money, 'SNAPSHOT_PATH', str(tmpdir.join('r')))
+        monkeypatch.setattr(Currency, 'convert', Currency.convert)
+        assert Currency(usd=1).update_rates()
+        assert Currency(eur=3).usd == 6
+
+        def offline():
+            raise IOError("offline")
+        monkeypatch.setattr(money, '_PROVIDER', [offline])
+        monkeypatch.setattr(money, 'SNAPSHOT_PATH', str(tmpdir.join('x')))
+        assert not Currency(usd=1).update_rates()
+        assert Currency(eur=3).usd == 6
+
+
+class TestRateRefresher:
+    """Tests du renouvellement des taux de change en arrière-plan."""
+
+    def test_publish(self, monkeypatch):
+        """Tests de la publication des taux."""
+        monkeypatch.setattr(Currency, 'convert', Currency.convert)
+        rates = {'USD': 1, 'EUR': 2}
+        publish_rates(rates)
+        rates['EUR'] = 5
+        assert Currency(eur=1).usd == 2
+        assert Currency.convert is not rates
+
+    def test_thread(self, tmpdir, monkeypatch):
+        """Tests du renouvellement dans un thread d'arrière-plan."""
+        monkeypatch.setattr(Currency, 'convert', Currency.convert)
+        done = threading.Event()
+
+        def provider():
+            done.set()
+            return {'USD': 1, 'EUR': 3}
+        monkeypatch.setattr(money, '_PROVIDER', [provider])
+        refresher = RateRefresher(0.01, path=str(tmpdir.join('r'))).start()
+        assert done.wait(5)
+        refresher.stop()
+        assert Currency(eur=1).usd == 3
+
+    def test_unavailable(self, tmpdir, monkeypatch):
+        """Tests de la conservation des taux en l'absence de fournisseur."""
+        monkeypatch.setattr(Currency, 'convert', {'USD': 1, 'EUR': 2})
+        set_provider(file_provider(str(tmpdir.join('pouet.json'))))
+        try:
+            refresher = RateRefresher(path=str(tmpdir.join('r')))
+            assert not refresher.refresh()
+        finally:
+            set_provider(money.forex_provider)
+        assert Currency(eur=1).usd == 2
+
+    def test_asyncio(self, tmpdir, monkeypatch):
+        """Tests du renouvellement dans une boucle asyncio."""
+        asyncio = pytest.importorskip('asyncio')
+        monkeypatch.setattr(Currency, 'convert', Currency.convert)
+        monkeypatch.setattr(money, '_PROVIDER', [lambda: {'USD': 1, 'EUR': 4}])
+        loop = asyncio.new_event_loop()
+        try:
+            refresher = RateRefresher(0.01, path=str(tmpdir.join('r')))
+            refresher.schedule(loop)
+            loop.run_until_complete(asyncio.sleep(0.2))
+            refresher.stop()
+        finally:
+            loop.close()
+        assert Currency(eur=1).usd == 4
+
+
+class TestRateHistory:
+    """Tests de l'historique des taux de change."""
+
+    def history(self):
+        history = RateHistory()
+        history.add('2020-01-10', {'EUR': 2, 'JPY': 100})
+        history.add(date(2020, 1, 1), {'EUR': 1})
+        history.add('2020-01-20', {'eur': 3})
+        return history
+
+    def test_rate(self):
+        """Tests de la recherche du taux applicable à une date."""
+        history = self.history()
+        assert len(history) == 4
+        assert history.currencies() == ['EUR', 'JPY']
+        assert 'eur' in history and 'GBP' not in history
+        assert history.rate('EUR', '2020-01-01') == 1
+        assert history.rate('eur', date(2020, 1, 15)) == 2
+        assert history.rate('EUR', datetime(2021, 1, 1, 12)) == 3
+        history.add('2020-01-10', {'EUR': 2.5})
+        assert history.rate('EUR', '2020-01-10') == 2.5
+        assert history.currency(2, 'EUR', '2020-01-25') == Currency(usd=6)
+        with pytest.raises(KeyError):
+            history.rate('JPY', '2020-01-09')
+        with pytest.raises(KeyError):
+            history.rate('GBP', '2020-01-09')
+
+    def test_load(self, tmpdir):
+        """Tests du chargement de taux depuis des fichiers."""
+        tmpdir.join('rates.json').write(
+            '{"2020-01-01": {"EUR": 1}, "2020-02-01": {"EUR": 2}}')
+        history = RateHistory().load(str(tmpdir.join('rates.json')))
+        assert history.rate('EUR', '2020-01-31') == 1
+        snapshots = tmpdir.mkdir('snapshots')
+        snapshots.join('2020-03-01.json').write(
+            '{"timestamp": 0, "rates": {"EUR": 3}}')
+        snapshots.join('2020-04-01.json').write('{"EUR": 4}')
+        history.load(str(snapshots))
+        assert history.rate('EUR', '2020-03-31') == 3
+        assert history.rate('EUR', '2020-04-01') == 4
+
+    def test_convert(self):
+        """Tests de la conversion vectorisée de montants datés."""
+        pytest.importorskip('numpy')
+        history = self.history()
+        result = history.convert(
+            [1, 1, 2, 1], ['EUR', 'jpy', 'EUR', 'EUR'],
+            ['2020-01-05', '2020-01-10', date(2020, 1, 12), '2020-02-01'])
+        assert list(result.usd) == [1, 100, 4, 3]
+        with pytest.raises(KeyError):
+            history.convert([1], ['JPY'], ['2019-01-01'])
+        with pytest.raises(KeyError):
+            history.convert([1], ['GBP'], ['2020-01-01'])
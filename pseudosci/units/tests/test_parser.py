@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+from .. import parse, UnitBase
+from ..parser import _COMPILED
+from ..general import Distance, Time, Velocity, Acceleration, Mass, \
+    Force, Area, Frequency, KPH_MPS
+from ..heat import Temperature, C_K
+import pytest
+
+
+class TestParse:
+    """Tests de la fonction pseudosci.units.parse"""
+
+    def test_simple(self):
+        """Tests de mesures à une seule unité."""
+        assert parse("30.5 t") == Mass(t=30.5)
+        assert parse("3 mph") == Velocity(mph=3)
+        assert parse("-2.5e3m") == Distance(m=-2500)
+        assert parse(" 2 kHz ") == Frequency(hz=2000)
+        assert parse("3 ms") == Time(s=0.003)
+        assert parse("42") == 42.0
+        assert parse("25 c", Temperature).k == 25 + C_K
+
+    def test_compound(self):
+        """Tests de mesures à unités composées."""
+        assert parse("80 km/h") == Velocity(kph=80)
+        assert parse("80 km/h").mps == 80 * 1000.0 / 3600
+        assert parse("1.4 m/s^2") == Acceleration(mpss=1.4)
+        assert parse("1.4 m.s^-2") == Acceleration(mpss=1.4)
+        assert parse("5 kg*m/s**2") == Force(n=5)
+        assert parse("2 m/s/s") == Acceleration(mpss=2)
+        assert parse("3 m^2") == Area(m2=3)
+        assert parse("4 m/m") == 4.0
+        assert type(parse("1 kg^2")) is UnitBase.quantity({'M': 2})
+        assert parse("80 km/h", Velocity).kph == 80 * 1000.0 / 3600 / KPH_MPS
+
+    def test_cache(self):
+        """Tests de la mémorisation des expressions d'unités."""
+        parse("12 km/h")
+        assert ("km/h", None) in _COMPILED
+        assert parse("12 km/h") == Velocity(kph=12)
+        parse("1 h", Time)
+        assert ("h", Time) in _COMPILED
+
+    def test_errors(self):
+        """Tests des erreurs d'analyse."""
+        with pytest.raises(ValueError):
+            parse("pouet")
+        with pytest.raises(ValueError):
+            parse("3 pouet")
+        with pytest.raises(ValueError):
+            parse("3 km/pouet")
+        with pytest.raises(ValueError):
+            parse("3 km", Time)
+        with pytest.raises(ValueError):
+            parse("3 km/h", Time)
+        with pytest.raises(ValueError):
+            parse("3 c/s", Temperature)
+        with pytest.raises(ValueError):
+            parse("3", Time)
+
+    def test_priority(self):
+        """Tests de la priorité des unités partageant un nom."""
+        from ..electricity import MagneticField, Charge
+        assert parse("30.5 t") == Mass(t=30.5)
+        assert parse("25 c") == Temperature(c=25)
+        assert parse("2 T") == MagneticField(t=2)
+        assert parse("2 C") == Charge(c=2)
+        assert parse("2 KM") == Distance(km=2)
+
+    def test_imports(self):
+        """Tests de l'analyse sans importation préalable des unités."""
+        import subprocess
+        import sys
+        code = ("import pseudosci.units\n"
+                "print(pseudosci.units.parse('80 km/h').kph)")
+        assert float(subprocess.check_output(
+            [sys.executable, '-c', code])) == pytest.approx(80)
+        code = ("import pseudosci.units.electricity, pseudosci.units.heat\n"
+                "from pseudosci.units import parse\n"
+                "print(type(parse('30.5 t')).__name__, "
+                "type(parse('25 c')).__name__)")
+        assert subprocess.check_output([sys.executable, '-c', code]).split() \
+            == [b'Mass', b'Temperature']
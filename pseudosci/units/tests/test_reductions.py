@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+from .. import usum, mean, umin, umax, weighted_mean
+from .. import reductions
+from ..general import Distance, Time
+import pytest
+
+
+class TestReductions:
+    """Tests des réductions de pseudosci.units.reductions"""
+
+    def test_usum(self):
+        """Tests de la somme d'unités."""
+        assert usum([Time(s=1), Time(min=1)]) == Time(s=61)
+        assert usum(Time(s=0.1) for _ in range(10)) == Time(s=1)
+        assert usum([], Distance) == Distance(m=0)
+        assert usum([Distance(m=2)], Distance) == Distance(m=2)
+        with pytest.raises(ValueError):
+            usum([])
+        with pytest.raises(TypeError):
+            usum([Time(s=1), Distance(m=1)])
+        with pytest.raises(TypeError):
+            usum([Time(s=1)], Distance)
+        with pytest.raises(TypeError):
+            usum([1, 2])
+
+    def test_statistics(self):
+        """Tests des moyennes et extremums."""
+        distances = [Distance(m=1), Distance(m=5), Distance(m=3)]
+        assert mean(iter(distances)) == Distance(m=3)
+        assert umin(distances) == Distance(m=1)
+        assert umax(d for d in distances) == Distance(m=5)
+        assert reductions.min(distances) == Distance(m=1)
+        assert weighted_mean(distances, [1, 0, 1]) == Distance(m=2)
+        assert weighted_mean(distances, (w for w in [0, 1, 1])) == \
+            Distance(m=4)
+        with pytest.raises(ValueError):
+            weighted_mean(distances, [0, 0, 0])
+        assert weighted_mean(
+            [Distance(m=1e16), Distance(m=1), Distance(m=-1e16)],
+            [1, 3, 1]) == Distance(m=0.6)
+        with pytest.raises(ValueError):
+            weighted_mean(distances, [1, 1])
+        with pytest.raises(ValueError):
+            weighted_mean(iter(distances), (w for w in [1, 1, 1, 1]))
+        with pytest.raises(ValueError):
+            mean([])
+
+    def test_star_import(self):
+        """Test de l'import de tous les noms du paquet, qui ne doit pas
+        masquer les fonctions natives."""
+        names = {}
+        exec('from pseudosci.units import *', names)
+        assert 'umin' in names and 'umax' in names
+        assert 'min' not in names and 'max' not in names
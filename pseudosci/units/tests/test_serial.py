@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import pickle
+import subprocess
+import sys
+from .. import dumps, loads, UnitBase
+from ..serial import reference, resolve
+from ..general import Distance, Time, Velocity, Mass
+from ...data.constants import LIGHT_VELOCITY
+import pytest
+
+
+class TestSerial:
+    """Tests de la sérialisation binaire de pseudosci.units.serial"""
+
+    def test_unit(self):
+        """Tests de la sérialisation d'une unité."""
+        data = dumps(Distance(km=3))
+        assert loads(data) == Distance(km=3)
+        assert type(loads(data)) is Distance
+        assert len(data) == 6 + len("pseudosci.units.general:Distance") + 8
+        assert loads(dumps(LIGHT_VELOCITY)) == LIGHT_VELOCITY
+
+    def test_list(self):
+        """Tests de la sérialisation d'une séquence d'unités."""
+        times = [Time(s=i) for i in range(100)]
+        data = dumps(times)
+        assert len(data) == 6 + len("pseudosci.units.general:Time") + 8 + \
+            100 * 8
+        assert loads(data) == times
+        assert loads(dumps(t for t in times[:3])) == times[:3]
+        assert loads(dumps([])) == []
+        with pytest.raises(TypeError):
+            dumps([Time(s=1), Distance(m=1)])
+        with pytest.raises(TypeError):
+            dumps([1.0])
+
+    def test_errors(self):
+        """Tests des données invalides."""
+        data = dumps([Time(s=1), Time(s=2)])
+        with pytest.raises(ValueError):
+            loads(data[:-1])
+        with pytest.raises(ValueError):
+            loads(dumps(Time(s=1))[:-1])
+        with pytest.raises(ValueError):
+            loads(b'XX' + data[2:])
+        with pytest.raises(ValueError):
+            loads(data.replace(b'Time', b'Pouf'))
+        with pytest.raises(ValueError):
+            loads(data.replace(b'general', b'generic'))
+        # Données de la version 1, ne portant que le nom de l'unité
+        assert loads(b'PU\x01u\x04\x00Time' + data[-8:]) == Time(s=2)
+
+    def test_pickle(self):
+        """Tests de la sérialisation par pickle."""
+        velocity = Velocity(kph=80)
+        assert pickle.loads(pickle.dumps(velocity)) == velocity
+        assert len(pickle.dumps(velocity, pickle.HIGHEST_PROTOCOL)) < 120
+
+    def test_references(self):
+        """Tests des références d'unités."""
+        assert reference(Distance) == 'pseudosci.units.general:Distance'
+        assert resolve(reference(Distance)) is Distance
+        area = type(Mass(kg=2) * Mass(kg=3))
+        assert reference(area) == ':M=2'
+        assert resolve(':M=2') is area
+        assert loads(dumps(Mass(kg=2) * Mass(kg=3))) == Mass(kg=2) * \
+            Mass(kg=3)
+        assert resolve('Distance') is Distance
+        assert resolve(reference(UnitBase.quantity({'L': 1}))) is Distance
+        with pytest.raises(ValueError):
+            resolve(':M=pouet')
+        with pytest.raises(ValueError):
+            resolve('pseudosci.units.nothing:Distance2')
+
+    def test_processes(self):
+        """Tests de la lecture dans un processus n'ayant pas importé les
+        unités."""
+        data = pickle.dumps([Distance(km=2), Mass(kg=2) * Mass(kg=1)])
+        code = ("import pickle, sys\n"
+                "units = pickle.loads(sys.stdin.buffer.read())\n"
+                "print(' '.join(str(u.value) for u in units))")
+        process = subprocess.Popen([sys.executable, '-c', code],
+                                   stdin=subprocess.PIPE,
+                                   stdout=subprocess.PIPE)
+        assert process.communicate(data)[0].split() == [b'2000.0', b'2.0']
+
+    def test_arrays(self):
+        """Tests de la sérialisation des tableaux d'unités."""
+        arrays = pytest.importorskip('pseudosci.units.arrays')
+        distances = arrays.UnitArray.of(Distance)(km=[1, 2, 3])
+        result = loads(dumps(distances))
+        assert type(result) is type(distances)
+        assert list(result.values) == [1000, 2000, 3000]
+        result = pickle.loads(pickle.dumps(distances))
+        assert list(result.values) == [1000, 2000, 3000]
+        result.values[0] = 5
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+
+import pytest
+pytest.importorskip('numpy')
+from ..store import UnitStore  # noqa: E402
+from ..arrays import UnitArray  # noqa: E402
+from ..general import Distance, Time, Velocity  # noqa: E402
+
+
+class TestUnitStore:
+    """Tests de la classe pseudosci.units.store.UnitStore"""
+
+    def test_write(self, tmpdir):
+        """Tests de l'écriture et de la relecture de colonnes."""
+        store = UnitStore(str(tmpdir.join('store')))
+        assert store.write('distance', (Distance(km=i) for i in range(10)),
+                           chunksize=3) == 10
+        store.write('velocity', UnitArray.of(Velocity)(kph=[36, 72]))
+        assert store.names() == ['distance', 'velocity']
+        assert 'distance' in store and 'time' not in store
+        assert store.unit('distance') is Distance
+        distances = store['distance']
+        assert type(distances) is UnitArray.of(Distance)
+        assert list(distances[2:4].km) == [2, 3]
+        assert distances[9] == Distance(km=9)
+        assert list(store.open('velocity').mps) == [10, 20]
+        assert tmpdir.join('store', 'distance.f64').size() == 80
+
+    def test_append(self, tmpdir):
+        """Tests de l'ajout de mesures et de la modification en place."""
+        store = UnitStore(str(tmpdir))
+        store.append('time', [Time(s=1)])
+        assert store.append('time', [Time(s=2), Time(s=3)]) == 3
+        times = store.open('time', writable=True)
+        times[0] = Time(s=10)
+        del times
+        assert list(UnitStore(str(tmpdir))['time'].s) == [10, 2, 3]
+        with pytest.raises(TypeError):
+            store.append('time', [Time(s=4), Distance(m=1)])
+        with pytest.raises(TypeError):
+            store.append('time', UnitArray.of(Distance)(m=[1]))
+        assert store.append('time', [Time(s=5)]) == 4
+        assert list(store['time'].s) == [10, 2, 3, 5]
+        store.write('time', [Time(s=4)])
+        assert list(store['time'].s) == [4]
+        store.delete('time')
+        with pytest.raises(KeyError):
+            store['time']
+        with pytest.raises(ValueError):
+            store.write('empty', [])
+        assert store.names() == [] and tmpdir.listdir() == []
+
+    def test_replace(self, tmpdir):
+        """Tests du remplacement d'une colonne."""
+        store = UnitStore(str(tmpdir))
+        store.write('time', [Time(s=1), Time(s=2)])
+        with pytest.raises(TypeError):
+            store.write('time', [Time(s=3), Distance(m=1)])
+        assert list(store['time'].s) == [1, 2]
+        assert sorted(f.basename for f in tmpdir.listdir()) == \
+            ['time.f64', 'time.json']
+        store.write('time', UnitArray.of(Time)(s=[3]))
+        assert list(store['time'].s) == [3]
+
+    def test_processes(self, tmpdir):
+        """Tests de l'ouverture dans un processus n'ayant pas importé les
+        unités."""
+        import subprocess
+        import sys
+        UnitStore(str(tmpdir)).write('d', [Distance(km=2)])
+        assert 'pseudosci.units.general:Distance' in \
+            tmpdir.join('d.json').read()
+        code = ("import sys\n"
+                "from pseudosci.units.store import UnitStore\n"
+                "print(UnitStore(sys.argv[1])['d'].km[0])")
+        assert float(subprocess.check_output(
+            [sys.executable, '-c', code, str(tmpdir)])) == 2.0
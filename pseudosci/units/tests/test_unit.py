@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 
-from .. import UnitBase, Unit
+from ... import units
+from .. import UnitBase, Unit, ConversionAttribute, Affine, _OPERATIONS
 import pytest
 
 
@@ -11,6 +12,7 @@ class UnitOne(Unit):
     fullname = "unit"
     pluralname = "units"
     convert = {'tupletest': (lambda v: 100 * v, lambda v: v / 100)}
+    dimension = {'X': 1}
 
 
 class UnitTwo(Unit):
@@ -18,7 +20,25 @@ class UnitTwo(Unit):
     pseudosci.units.Unit."""
     fullname = "unit"
     pluralname = "units"
-    inverse = "UnitOne"
+    dimension = {'X': -1}
+
+
+class UnitThree(Unit):
+    """Classe utilisée comme type d'unité sans dimension pour les tests
+    unitaires de pseudosci.units.Unit."""
+    fullname = "unit"
+    pluralname = "units"
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Isoler du registre global les unités définies au cours d'un test."""
+    monkeypatch.setattr(UnitBase, 'units', dict(UnitBase.units))
+    monkeypatch.setattr(UnitBase, 'dimensions', dict(UnitBase.dimensions))
+    operations = dict(_OPERATIONS)
+    yield
+    _OPERATIONS.clear()
+    _OPERATIONS.update(operations)
 
 
 class TestUnitBase:
@@ -42,6 +62,55 @@ class TestUnit:
         assert UnitOne(value=100).tupletest == 1
         assert UnitOne(tupletest=1).value == 100
 
+    def test_from_si(self):
+        """Test du constructeur rapide de la classe."""
+        u = UnitOne.from_si(123.4)
+        assert type(u) is UnitOne
+        assert u.value == 123.4
+        assert u == UnitOne(value=123.4)
+        assert u.tupletest == 1.234
+        assert not hasattr(u, '__dict__')
+        with pytest.raises(AttributeError):
+            UnitOne.__new__(UnitOne).value
+
+    def test_convert_many(self):
+        """Test de la conversion de séquences de valeurs."""
+        from array import array
+        assert UnitOne.convert_many([1, 2], dst='tupletest') == \
+            array('d', [0.01, 0.02])
+        assert UnitOne.convert_many((1, 2), 'tupletest') == \
+            array('d', [100.0, 200.0])
+        assert UnitOne.convert_many(array('d', [1.5]), 'value') == \
+            array('d', [1.5])
+        assert UnitOne.convert_many(iter([])) == array('d')
+        with pytest.raises(ValueError):
+            UnitOne.convert_many([1], 'pouet')
+        with pytest.raises(ValueError):
+            UnitOne.convert_many([1], dst='pouet')
+
+    def test_prefixes(self):
+        """Test des conversions préfixées des unités nommées."""
+        from ..general import Distance, Energy, Frequency, Mass, MI_M
+        assert Energy(GJ=2).j == 2e9
+        assert Frequency(kHz=1).hz == 1e3
+        assert Distance(um=1).m == 1e-6
+        assert Distance(Mm=1).m == 1e6
+        assert Distance(mm=1).m == 1e-3
+        assert Distance(mi=1).m == MI_M
+        assert Mass(mg=1).kg == 1e-6
+        assert Mass(MG=1).kg == 1e-6
+        assert Mass(UG=1).kg == pytest.approx(1e-9)
+        assert Mass(ng=1).kg == pytest.approx(1e-12)
+        mass = Mass(kg=1)
+        mass.mg = 5
+        assert mass.mg == pytest.approx(5)
+        mass.ug = 5
+        assert mass.kg == pytest.approx(5e-9)
+        assert list(Energy.convert_many([1, 2], 'kJ', 'J')) == \
+            [1000.0, 2000.0]
+        with pytest.raises(ValueError):
+            UnitOne(kvalue=1)
+
     def test_setattr(self):
         """Test de modification des attributs de la classe."""
         u = UnitOne(value=123.4)
@@ -53,8 +122,51 @@ class TestUnit:
         assert u.value == 1337.0
         u.value = 12.0
         assert u.value == 12.0
-        u.dummyattribute = "you dummy"
-        assert u.dummyattribute == "you dummy"
+        u.DOZENS = 1
+        assert u.value == 10.0
+        u.TUPLETEST = 1
+        assert u.value == 100.0
+        u.Tupletest = 2
+        assert u.value == 200.0
+        assert type(u).__setattr__ is object.__setattr__
+        assert not hasattr(u, '__dict__')
+        with pytest.raises(AttributeError):
+            u.dummyattribute = "you dummy"
+
+    def test_conversion_attributes(self):
+        """Test des descripteurs de conversion installés sur la classe."""
+        assert isinstance(UnitOne.tupletest, ConversionAttribute)
+        u = UnitOne(value=100)
+        assert u.tupletest == u.TupleTest == 1
+        u.tupletest = 2
+        assert u.value == 200
+        UnitOne.convert['Pouet'] = 2.0
+        assert isinstance(UnitOne.Pouet, ConversionAttribute)
+        assert u.Pouet == u.pouet == 100
+        u.Pouet = 1
+        assert u.value == 2.0
+        del UnitOne.convert['Pouet']
+        assert 'pouet' not in vars(UnitOne)
+        assert 'Pouet' not in vars(UnitOne)
+
+    def test_conversion_index(self):
+        """Test de l'index des conversions de la classe."""
+        assert UnitOne(TupleTest=1).value == 100
+        assert UnitOne(value=100).convertto('TUPLETEST') == 1
+        with pytest.raises(ValueError):
+            UnitOne(value=1).convertto('pouet')
+        UnitOne.convert['Pouet'] = 2.0
+        assert UnitOne(value=4).pouet == 2.0
+        del UnitOne.convert['Pouet']
+        with pytest.raises(AttributeError):
+            UnitOne(value=4).pouet
+        previous = UnitOne.convert
+        UnitOne.convert = {'tupletest': 4.0}
+        try:
+            assert UnitOne(tupletest=2).value == 8.0
+        finally:
+            UnitOne.convert = previous
+        assert UnitOne(tupletest=1).value == 100
 
     def test_math(self):
         """Tests des opérations mathématiques de la classe."""
@@ -78,9 +190,8 @@ class TestUnit:
         assert (1 / UnitTwo(value=2)).value == 0.5
         assert (1 // UnitTwo(value=2)).value == 0
         assert int(UnitOne(value=23.4)) == 23
-        u = UnitOne(value=4)
-        u.divide = {'UnitTwo': 'UnitOne'}
-        assert (u // UnitTwo(value=2)).value == 2
+        assert (UnitOne(value=4) * UnitTwo(value=2)) == 8.0
+        assert (UnitOne(value=4) // UnitTwo(value=3)).value == 1
 
     def test_math_errors(self):
         """Tests des erreurs dans les opérations mathématiques de la classe."""
@@ -89,15 +200,170 @@ class TestUnit:
         with pytest.raises(TypeError):
             UnitTwo(value=4) - UnitOne(value=1)
         with pytest.raises(TypeError):
-            UnitTwo(value=4) * UnitOne(value=1)
+            UnitThree(value=4) * UnitOne(value=1)
+        with pytest.raises(TypeError):
+            UnitTwo(value=4) / UnitThree(value=1)
         with pytest.raises(TypeError):
-            UnitTwo(value=4) / UnitOne(value=1)
+            UnitThree(value=4) // UnitOne(value=1)
         with pytest.raises(TypeError):
-            UnitTwo(value=4) // UnitOne(value=1)
+            1 / UnitThree(value=4)
         assert UnitOne(value=1).__pow__(UnitTwo(value=1)) == NotImplemented
 
+    def test_dimensions(self):
+        """Tests de la résolution des unités par leur dimension."""
+        assert UnitBase.quantity({'X': 1}) is UnitOne
+        assert UnitBase.quantity({'X': -1, 'Y': 0}) is UnitTwo
+        assert UnitBase.quantity({}) is float
+        derived = UnitOne(value=4) / UnitTwo(value=2)
+        assert derived.value == 2.0
+        assert type(derived).__name__ == 'Derived[X^2]'
+        assert type(derived) is UnitBase.quantity({'X': 2})
+        assert str(derived) == '2.0 X^2'
+        assert (derived / UnitOne(value=2)).__class__ is UnitOne
+        assert UnitThree._dimension is None
+
+    def test_dimensions_chained(self):
+        """Tests de formules enchaînant plusieurs unités nommées."""
+        from ..general import Mass, Velocity, Energy, Time, Frequency
+        energy = Mass(kg=2) * Velocity(mps=3) * Velocity(mps=3) / 2
+        assert type(energy) is Energy
+        assert energy.j == 9.0
+        assert type(1 / Time(s=2)) is Frequency
+        assert type(Mass(kg=1) * Mass(kg=1)).__name__ == 'Derived[kg^2]'
+
+    def test_pow(self):
+        """Tests de l'élévation des unités à une puissance."""
+        from ..general import Distance, Area, Volume, Frequency, Time
+        assert type(Distance(m=3) ** 2) is Area
+        assert (Distance(m=3) ** 2).m2 == 9.0
+        assert type(Distance(m=2) ** 3) is Volume
+        assert (Distance(m=2) ** 3).m3 == 8.0
+        assert (Time(s=4) ** -1) == Frequency(hz=0.25)
+        assert Distance(m=4) ** 0 == 1.0
+        assert Distance(m=4) ** 1 == Distance(m=4)
+        assert (Area(m2=16) ** 0.5) == Distance(m=4)
+        assert Area(m2=16).sqrt() == Distance(m=4)
+        assert (Volume(m3=8) ** (1 / 3.0)).m == 2.0
+        assert (UnitThree(value=4) ** 1).value == 4.0
+        assert UnitThree(value=4) ** 0 == 1.0
+        with pytest.raises(ValueError):
+            Distance(m=4) ** 0.5
+        with pytest.raises(ValueError):
+            UnitThree(value=4) ** 2
+        with pytest.raises(ValueError):
+            Area(m2=-4) ** 0.5
+        assert (Area(m2=-4) ** 1.0).m2 == -4.0
+        assert (Distance(m=-2) ** 2).m2 == 4.0
+        assert (Area(m2=4) ** 1.5).m3 == 8.0
+        assert (Area, 1.5, 'pow') in _OPERATIONS
+        assert (Area, 0.5, 'pow') in _OPERATIONS
+        assert (Distance, 0.5, 'pow') not in _OPERATIONS
+
+    def test_pow_cache_size(self, registry, monkeypatch):
+        """Test de la taille bornée du cache des puissances."""
+        from ..general import Area
+        monkeypatch.setattr(units, 'OPERATIONS_SIZE', 8)
+        _OPERATIONS.clear()
+        for i in range(20):
+            Area(m2=4) ** (1.5 + i * 1e-12)
+            assert len(_OPERATIONS) <= 8
+        assert (Area(m2=4) ** 1.5).m3 == pytest.approx(8.0)
+
+    def test_dispatch_cache(self, registry):
+        """Tests du cache de résolution des opérations."""
+        UnitOne(value=1) * UnitTwo(value=1)
+        UnitOne(value=1) - 2
+        assert (UnitOne, UnitTwo, 'mul') in _OPERATIONS
+        assert (UnitOne, int, 'sub') in _OPERATIONS
+        assert UnitThree(value=1).__mul__(UnitOne(value=1)) == NotImplemented
+        assert (UnitThree, UnitOne, 'mul') in _OPERATIONS
+        derived = type(UnitOne(value=2) * UnitOne(value=3))
+        assert derived._derived
+
+        class UnitOneSquared(Unit):
+            fullname = "unit squared"
+            pluralname = "units squared"
+            dimension = {'X': 2}
+
+        assert not _OPERATIONS
+        assert type(UnitOne(value=2) * UnitOne(value=3)) is UnitOneSquared
+
     def test_compare(self):
         """Tests des opérations de comparaison de la classe."""
         assert UnitOne(value=1) == UnitOne(value=1)
         assert UnitOne(value=1) != UnitOne(value=2)
         assert UnitOne(value=1).__eq__(UnitTwo(value=1)) == NotImplemented
+        assert UnitOne(value=1) < UnitOne(value=2) <= UnitOne(value=2)
+        assert UnitOne(value=3) > UnitOne(value=2) >= UnitOne(value=2)
+        assert sorted([UnitOne(value=3), UnitOne(value=1)]) == \
+            [UnitOne(value=1), UnitOne(value=3)]
+        with pytest.raises(TypeError):
+            UnitOne(value=1) < UnitTwo(value=2)
+        with pytest.raises(TypeError):
+            UnitOne(value=1) < 2
+
+    def test_hash(self):
+        """Tests du hachage des instances de la classe."""
+        assert hash(UnitOne(value=1)) == hash(UnitOne(value=1))
+        assert len({UnitOne(value=1), UnitOne(value=1), UnitOne(value=2),
+                    UnitTwo(value=1)}) == 3
+        assert {UnitOne(value=4): 'a'}[UnitOne(value=4)] == 'a'
+        # Limitation documentée : une unité modifiée dans un ensemble n'y
+        # est plus retrouvée, contrairement à une constante
+        u = UnitOne(value=5)
+        members = {u}
+        u.value = 6
+        assert UnitOne(value=6) not in members
+        assert UnitOne.constant(value=5) in {UnitOne.constant(value=5)}
+
+    def test_constant(self):
+        """Tests des instances immuables et partagées de la classe."""
+        u = UnitOne.constant(value=3)
+        assert u is UnitOne.constant(value=3)
+        assert u == UnitOne(value=3)
+        assert UnitOne.constant(value=3) is not UnitTwo.constant(value=3)
+        with pytest.raises(AttributeError):
+            u.value = 4
+        with pytest.raises(AttributeError):
+            u.tupletest = 4
+        with pytest.raises(AttributeError):
+            u._frozen = False
+        assert u.value == 3
+        assert type(u + u) is UnitOne and (u + u).value == 6
+        assert isinstance(u, UnitOne) and u.tupletest == 0.03
+        assert UnitOne(value=3) == u and UnitOne(value=2) < u
+        assert type(u * 2) is UnitOne and type(2 - u) is UnitOne
+        assert type(UnitOne(value=1) + u) is UnitOne
+        assert UnitOne(value=3).__hash__() == u.__hash__()
+        assert Unit.__slots__ == ('value', )
+        v = UnitOne(value=1)
+        v.value = 2
+        assert v.value == 2
+        with pytest.raises(ValueError):
+            UnitOne.constant(pouet=3)
+
+    def test_constant_cache(self, monkeypatch):
+        """Tests de la limite du cache des instances partagées."""
+        monkeypatch.setattr(units, 'INTERNED_SIZE', 2)
+        (a, b) = (UnitOne.constant(value=1), UnitOne.constant(value=2))
+        assert UnitOne.constant(value=1) is a
+        UnitOne.constant(value=3)
+        assert UnitOne.constant(value=1) is a
+        assert UnitOne.constant(value=2) is not b
+
+    def test_affine(self):
+        """Tests des conversions affines de la classe."""
+        assert UnitOne.affine('tupletest') is None
+        assert UnitOne.affine('value', 'value') == Affine(1)
+        linear = Affine(1000)
+        assert linear.linear and not Affine(1, 2).linear
+        assert linear.then(Affine(10)) == Affine(100)
+        assert linear.functions()[0](3) == 3000
+        assert linear.functions()[1](3000) == 3
+        affine = Affine(2, 10, 1)
+        assert affine(3) == 14 and affine.inverse(14) == 3
+        assert affine.delta(3) == 6
+        assert affine.then(affine)(7) == 7
+        assert affine.inverted()(14) == 3
+        assert hash(affine) == hash(Affine(2, 10, 1))
+        assert affine != linear